@@ -8,6 +8,7 @@ Requirements: 4.4, 4.5, 7.2, 7.3, 7.4, 7.5, 7.6
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -23,6 +24,9 @@ from podtext.core.processor import convert_html_to_markdown, remove_advertisemen
 # Maximum length for show notes before truncation
 MAX_SHOW_NOTES_LENGTH = 50000
 
+# Whitespace after sentence-ending punctuation, where unbroken text is split
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
 
 def _format_frontmatter(
     episode: EpisodeInfo,
@@ -204,17 +208,14 @@ def _add_paragraph_breaks(text: str) -> str:
 
     # If text has single newlines, convert them to paragraph breaks
     if "\n" in text:
-        lines = text.split("\n")
-        non_empty_lines = [line.strip() for line in lines if line.strip()]
+        stripped_lines = (line.strip() for line in text.split("\n"))
+        non_empty_lines = [line for line in stripped_lines if line]
         if non_empty_lines:
             return "\n\n".join(non_empty_lines)
         return text
 
     # No newlines - split text into sentences and group them into paragraphs
-    import re
-
-    # Split on sentence-ending punctuation followed by space
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = SENTENCE_BOUNDARY.split(text)
 
     if len(sentences) <= 1:
         return text
@@ -319,19 +320,7 @@ def generate_markdown(
         ... )
         >>> generate_markdown(episode, transcription, analysis, Path("output.md"))
     """
-    # Generate frontmatter (without summary)
-    frontmatter = _format_frontmatter(episode, analysis, podcast_name)
-
-    # Format content with summary, show notes, and ad removal
-    content = _format_content(
-        transcription,
-        analysis.ad_markers,
-        show_notes=episode.show_notes,
-        summary=analysis.summary,
-    )
-
-    # Combine frontmatter and content
-    markdown_output = f"{frontmatter}\n{content}\n"
+    markdown_output = generate_markdown_string(episode, transcription, analysis, podcast_name)
 
     # Ensure parent directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
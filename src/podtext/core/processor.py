@@ -13,9 +13,15 @@ import re
 # Marker text inserted where advertisements are removed
 ADVERTISEMENT_MARKER = "ADVERTISEMENT WAS REMOVED"
 
+# The marker as it appears in processed text (with brackets for visibility)
+ADVERTISEMENT_MARKER_TEXT = f"[{ADVERTISEMENT_MARKER}]"
+
 # Characters invalid in file paths (covers Windows, macOS, Linux)
 INVALID_PATH_CHARS = re.compile(r'[/\\:*?"<>|]')
 
+# Runs of underscores, collapsed to one after replacing invalid characters
+UNDERSCORE_RUNS = re.compile(r"_+")
+
 
 def sanitize_path_component(
     name: str,
@@ -59,7 +65,7 @@ def sanitize_path_component(
     result = INVALID_PATH_CHARS.sub("_", name)
 
     # Collapse consecutive underscores into single underscore
-    result = re.sub(r"_+", "_", result)
+    result = UNDERSCORE_RUNS.sub("_", result)
 
     # Trim leading/trailing whitespace and underscores
     result = result.strip().strip("_").strip()
@@ -230,8 +236,8 @@ def remove_advertisements(
         if current_pos < ad_start:
             result_parts.append(text[current_pos:ad_start])
 
-        # Add the marker (with brackets for visibility)
-        result_parts.append(f"[{ADVERTISEMENT_MARKER}]")
+        # Add the marker
+        result_parts.append(ADVERTISEMENT_MARKER_TEXT)
 
         # Move past the ad block
         current_pos = ad_end
@@ -0,0 +1,66 @@
+"""Shared pytest configuration for the Podtext test suite.
+
+Registers the Hypothesis settings profiles used by the property-based tests.
+Select a profile with the HYPOTHESIS_PROFILE environment variable.
+
+Temporary files go to /dev/shm when it is available, see pytest_configure.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+from hypothesis import HealthCheck, settings
+
+# Default profile: no on-disk example database, so property tests never write
+# to .hypothesis/examples. Properties without their own @settings run 25
+# examples instead of Hypothesis' default 100. Shrinking stays on so failures
+# report a minimal input. The generation-speed health checks are off because
+# they flake on busy machines.
+settings.register_profile(
+    "fast",
+    database=None,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large],
+    deadline=None,
+    max_examples=25,
+)
+
+# CI profile (make test-ci): the fast profile with a fixed seed, so every run
+# tries the same examples and failures reproduce locally with HYPOTHESIS_PROFILE=ci
+settings.register_profile("ci", parent=settings.get_profile("fast"), derandomize=True)
+
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "fast"))
+
+
+# Linux tmpfs mount; missing on macOS, where the hook below does nothing
+SHM_DIR = Path("/dev/shm")
+
+
+# Original tempfile.tempdir, saved only when pytest_configure redirected TMPDIR
+_ORIGINAL_TEMPDIR = pytest.StashKey[str | None]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep temporary test files in RAM when a writable tmpfs is available.
+
+    tmp_path, tmp_path_factory and the tempfile module all resolve their base
+    directory through TMPDIR. An explicit TMPDIR is left untouched, and
+    pytest_unconfigure undoes the redirect.
+    """
+    if "TMPDIR" in os.environ or not (SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK)):
+        return
+    config.stash[_ORIGINAL_TEMPDIR] = tempfile.tempdir
+    os.environ["TMPDIR"] = str(SHM_DIR)
+    # tempfile caches the directory it resolved first; make it look again
+    tempfile.tempdir = None
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Restore TMPDIR and the tempfile cache changed by pytest_configure."""
+    if _ORIGINAL_TEMPDIR not in config.stash:
+        return
+    del os.environ["TMPDIR"]
+    tempfile.tempdir = config.stash[_ORIGINAL_TEMPDIR]
@@ -8,12 +8,11 @@ Validates: Requirements 9.2
 
 from __future__ import annotations
 
-import tempfile
-import uuid
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
 from hypothesis import assume, given, settings
 from hypothesis import strategies as st
 
@@ -119,6 +118,16 @@ def create_prompts_markdown(
     return "\n\n".join(sections)
 
 
+@pytest.fixture(scope="module")
+def prompts_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory for the prompts files, shared by every example in the module.
+
+    Each example rewrites prompts.md before loading it and global_prompts.md is
+    never created, so no state carries over between examples.
+    """
+    return tmp_path_factory.mktemp("prompts")
+
+
 # =============================================================================
 # Property 13: Prompt Runtime Loading
 # =============================================================================
@@ -142,6 +151,7 @@ class TestPromptRuntimeLoading:
     )
     def test_detect_advertisements_uses_updated_prompts(
         self,
+        prompts_dir: Path,
         initial_prompt: str,
         updated_prompt: str,
     ) -> None:
@@ -159,92 +169,82 @@ class TestPromptRuntimeLoading:
         assume(initial_prompt not in updated_prompt)
         assume(updated_prompt not in initial_prompt)
 
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        prompts_dir = base_dir / f"prompts_{unique_id}"
-        prompts_dir.mkdir(parents=True)
-
         local_path = prompts_dir / "prompts.md"
         global_path = prompts_dir / "global_prompts.md"
 
-        try:
-            # Write initial prompts file
-            local_path.write_text(
-                create_prompts_markdown(
-                    ad_prompt=initial_prompt,
-                    summary_prompt="Summary prompt",
-                    topic_prompt="Topic prompt",
-                    keyword_prompt="Keyword prompt",
-                )
+        # Write initial prompts file
+        local_path.write_text(
+            create_prompts_markdown(
+                ad_prompt=initial_prompt,
+                summary_prompt="Summary prompt",
+                topic_prompt="Topic prompt",
+                keyword_prompt="Keyword prompt",
             )
+        )
 
-            # Track API calls to verify prompt content
-            api_calls: list[str] = []
+        # Track API calls to verify prompt content
+        api_calls: list[str] = []
 
-            with patch("podtext.services.claude._create_client") as mock_create_client:
-                mock_client = MagicMock()
-                mock_create_client.return_value = mock_client
+        with patch("podtext.services.claude._create_client") as mock_create_client:
+            mock_client = MagicMock()
+            mock_create_client.return_value = mock_client
 
-                def capture_call(*args: Any, **kwargs: Any) -> MagicMock:
-                    messages = kwargs.get("messages", [])
-                    if messages:
-                        api_calls.append(messages[0]["content"])
-                    return MagicMock(content=[MagicMock(text='{"advertisements": []}')])
+            def capture_call(*args: Any, **kwargs: Any) -> MagicMock:
+                messages = kwargs.get("messages", [])
+                if messages:
+                    api_calls.append(messages[0]["content"])
+                return MagicMock(content=[MagicMock(text='{"advertisements": []}')])
 
-                mock_client.messages.create.side_effect = capture_call
+            mock_client.messages.create.side_effect = capture_call
 
-                # First call - should use initial prompt
-                prompts1 = load_prompts(
-                    local_path=local_path,
-                    global_path=global_path,
-                    warn_on_fallback=False,
-                )
-                detect_advertisements(
-                    text="Test transcript",
-                    api_key="test-key",
-                    prompts=prompts1,
-                )
-
-                # Verify initial prompt was used
-                assert len(api_calls) == 1
-                assert initial_prompt in api_calls[0], (
-                    f"Initial prompt '{initial_prompt[:50]}...' should be in API call"
-                )
+            # First call - should use initial prompt
+            prompts1 = load_prompts(
+                local_path=local_path,
+                global_path=global_path,
+                warn_on_fallback=False,
+            )
+            detect_advertisements(
+                text="Test transcript",
+                api_key="test-key",
+                prompts=prompts1,
+            )
 
-                # Update the prompts file
-                local_path.write_text(
-                    create_prompts_markdown(
-                        ad_prompt=updated_prompt,
-                        summary_prompt="Summary prompt",
-                        topic_prompt="Topic prompt",
-                        keyword_prompt="Keyword prompt",
-                    )
-                )
+            # Verify initial prompt was used
+            assert len(api_calls) == 1
+            assert initial_prompt in api_calls[0], (
+                f"Initial prompt '{initial_prompt[:50]}...' should be in API call"
+            )
 
-                # Second call - should use updated prompt
-                prompts2 = load_prompts(
-                    local_path=local_path,
-                    global_path=global_path,
-                    warn_on_fallback=False,
-                )
-                detect_advertisements(
-                    text="Test transcript",
-                    api_key="test-key",
-                    prompts=prompts2,
+            # Update the prompts file
+            local_path.write_text(
+                create_prompts_markdown(
+                    ad_prompt=updated_prompt,
+                    summary_prompt="Summary prompt",
+                    topic_prompt="Topic prompt",
+                    keyword_prompt="Keyword prompt",
                 )
+            )
 
-                # Property: Subsequent calls SHALL use updated prompt content
-                assert len(api_calls) == 2
-                assert updated_prompt in api_calls[1], (
-                    f"Updated prompt '{updated_prompt[:50]}...' should be in API call"
-                )
-                assert initial_prompt not in api_calls[1], (
-                    "Initial prompt should NOT be in second API call"
-                )
-        finally:
-            import shutil
+            # Second call - should use updated prompt
+            prompts2 = load_prompts(
+                local_path=local_path,
+                global_path=global_path,
+                warn_on_fallback=False,
+            )
+            detect_advertisements(
+                text="Test transcript",
+                api_key="test-key",
+                prompts=prompts2,
+            )
 
-            shutil.rmtree(base_dir, ignore_errors=True)
+            # Property: Subsequent calls SHALL use updated prompt content
+            assert len(api_calls) == 2
+            assert updated_prompt in api_calls[1], (
+                f"Updated prompt '{updated_prompt[:50]}...' should be in API call"
+            )
+            assert initial_prompt not in api_calls[1], (
+                "Initial prompt should NOT be in second API call"
+            )
 
     @settings(max_examples=100)
     @given(
@@ -253,6 +253,7 @@ class TestPromptRuntimeLoading:
     )
     def test_analyze_content_uses_updated_summary_prompt(
         self,
+        prompts_dir: Path,
         initial_summary: str,
         updated_summary: str,
     ) -> None:
@@ -268,98 +269,88 @@ class TestPromptRuntimeLoading:
         # Ensure prompts are different
         assume(initial_summary.strip() != updated_summary.strip())
 
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        prompts_dir = base_dir / f"prompts_{unique_id}"
-        prompts_dir.mkdir(parents=True)
-
         local_path = prompts_dir / "prompts.md"
         global_path = prompts_dir / "global_prompts.md"
 
-        try:
-            # Write initial prompts file
-            local_path.write_text(
-                create_prompts_markdown(
-                    ad_prompt="Ad prompt",
-                    summary_prompt=initial_summary,
-                    topic_prompt="Topic prompt",
-                    keyword_prompt="Keyword prompt",
-                )
+        # Write initial prompts file
+        local_path.write_text(
+            create_prompts_markdown(
+                ad_prompt="Ad prompt",
+                summary_prompt=initial_summary,
+                topic_prompt="Topic prompt",
+                keyword_prompt="Keyword prompt",
             )
+        )
 
-            # Track API calls to verify prompt content
-            summary_calls: list[str] = []
+        # Track API calls to verify prompt content
+        summary_calls: list[str] = []
 
-            with patch("podtext.services.claude._create_client") as mock_create_client:
-                mock_client = MagicMock()
-                mock_create_client.return_value = mock_client
+        with patch("podtext.services.claude._create_client") as mock_create_client:
+            mock_client = MagicMock()
+            mock_create_client.return_value = mock_client
 
-                call_count = [0]
+            call_count = [0]
 
-                def capture_call(*args: Any, **kwargs: Any) -> MagicMock:
-                    messages = kwargs.get("messages", [])
-                    call_count[0] += 1
+            def capture_call(*args: Any, **kwargs: Any) -> MagicMock:
+                messages = kwargs.get("messages", [])
+                call_count[0] += 1
 
-                    # First call in analyze_content is summary
-                    if call_count[0] % 4 == 1 and messages:
-                        summary_calls.append(messages[0]["content"])
+                # First call in analyze_content is summary
+                if call_count[0] % 4 == 1 and messages:
+                    summary_calls.append(messages[0]["content"])
 
-                    # Return appropriate mock responses
-                    return MagicMock(content=[MagicMock(text="Summary response")])
+                # Return appropriate mock responses
+                return MagicMock(content=[MagicMock(text="Summary response")])
 
-                mock_client.messages.create.side_effect = capture_call
+            mock_client.messages.create.side_effect = capture_call
 
-                # First call - should use initial prompt
-                prompts1 = load_prompts(
-                    local_path=local_path,
-                    global_path=global_path,
-                    warn_on_fallback=False,
-                )
-                analyze_content(
-                    text="Test transcript",
-                    api_key="test-key",
-                    prompts=prompts1,
-                    warn_on_unavailable=False,
-                )
-
-                # Verify initial prompt was used
-                assert len(summary_calls) == 1
-                assert initial_summary in summary_calls[0], (
-                    "Initial summary prompt should be in first API call"
-                )
+            # First call - should use initial prompt
+            prompts1 = load_prompts(
+                local_path=local_path,
+                global_path=global_path,
+                warn_on_fallback=False,
+            )
+            analyze_content(
+                text="Test transcript",
+                api_key="test-key",
+                prompts=prompts1,
+                warn_on_unavailable=False,
+            )
 
-                # Update the prompts file
-                local_path.write_text(
-                    create_prompts_markdown(
-                        ad_prompt="Ad prompt",
-                        summary_prompt=updated_summary,
-                        topic_prompt="Topic prompt",
-                        keyword_prompt="Keyword prompt",
-                    )
-                )
+            # Verify initial prompt was used
+            assert len(summary_calls) == 1
+            assert initial_summary in summary_calls[0], (
+                "Initial summary prompt should be in first API call"
+            )
 
-                # Second call - should use updated prompt
-                prompts2 = load_prompts(
-                    local_path=local_path,
-                    global_path=global_path,
-                    warn_on_fallback=False,
-                )
-                analyze_content(
-                    text="Test transcript",
-                    api_key="test-key",
-                    prompts=prompts2,
-                    warn_on_unavailable=False,
+            # Update the prompts file
+            local_path.write_text(
+                create_prompts_markdown(
+                    ad_prompt="Ad prompt",
+                    summary_prompt=updated_summary,
+                    topic_prompt="Topic prompt",
+                    keyword_prompt="Keyword prompt",
                 )
+            )
 
-                # Property: Subsequent calls SHALL use updated prompt content
-                assert len(summary_calls) == 2
-                assert updated_summary in summary_calls[1], (
-                    "Updated summary prompt should be in second API call"
-                )
-        finally:
-            import shutil
+            # Second call - should use updated prompt
+            prompts2 = load_prompts(
+                local_path=local_path,
+                global_path=global_path,
+                warn_on_fallback=False,
+            )
+            analyze_content(
+                text="Test transcript",
+                api_key="test-key",
+                prompts=prompts2,
+                warn_on_unavailable=False,
+            )
 
-            shutil.rmtree(base_dir, ignore_errors=True)
+            # Property: Subsequent calls SHALL use updated prompt content
+            assert len(summary_calls) == 2
+            assert updated_summary in summary_calls[1], (
+                "Updated summary prompt should be in second API call"
+            )
 
     @settings(max_examples=100)
     @given(
@@ -369,6 +360,7 @@ class TestPromptRuntimeLoading:
     )
     def test_multiple_prompt_updates_all_reflected(
         self,
+        prompts_dir: Path,
         prompt_v1: str,
         prompt_v2: str,
         prompt_v3: str,
@@ -387,77 +379,67 @@ class TestPromptRuntimeLoading:
         assume(prompt_v2.strip() != prompt_v3.strip())
         assume(prompt_v1.strip() != prompt_v3.strip())
 
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        prompts_dir = base_dir / f"prompts_{unique_id}"
-        prompts_dir.mkdir(parents=True)
-
         local_path = prompts_dir / "prompts.md"
         global_path = prompts_dir / "global_prompts.md"
 
-        try:
-            api_calls: list[str] = []
-
-            with patch("podtext.services.claude._create_client") as mock_create_client:
-                mock_client = MagicMock()
-                mock_create_client.return_value = mock_client
+        api_calls: list[str] = []
 
-                def capture_call(*args: Any, **kwargs: Any) -> MagicMock:
-                    messages = kwargs.get("messages", [])
-                    if messages:
-                        api_calls.append(messages[0]["content"])
-                    return MagicMock(content=[MagicMock(text='{"advertisements": []}')])
+        with patch("podtext.services.claude._create_client") as mock_create_client:
+            mock_client = MagicMock()
+            mock_create_client.return_value = mock_client
 
-                mock_client.messages.create.side_effect = capture_call
+            def capture_call(*args: Any, **kwargs: Any) -> MagicMock:
+                messages = kwargs.get("messages", [])
+                if messages:
+                    api_calls.append(messages[0]["content"])
+                return MagicMock(content=[MagicMock(text='{"advertisements": []}')])
 
-                # Version 1
-                local_path.write_text(create_prompts_markdown(ad_prompt=prompt_v1))
-                prompts1 = load_prompts(
-                    local_path=local_path,
-                    global_path=global_path,
-                    warn_on_fallback=False,
-                )
-                detect_advertisements(
-                    text="Test",
-                    api_key="test-key",
-                    prompts=prompts1,
-                )
+            mock_client.messages.create.side_effect = capture_call
 
-                # Version 2
-                local_path.write_text(create_prompts_markdown(ad_prompt=prompt_v2))
-                prompts2 = load_prompts(
-                    local_path=local_path,
-                    global_path=global_path,
-                    warn_on_fallback=False,
-                )
-                detect_advertisements(
-                    text="Test",
-                    api_key="test-key",
-                    prompts=prompts2,
-                )
+            # Version 1
+            local_path.write_text(create_prompts_markdown(ad_prompt=prompt_v1))
+            prompts1 = load_prompts(
+                local_path=local_path,
+                global_path=global_path,
+                warn_on_fallback=False,
+            )
+            detect_advertisements(
+                text="Test",
+                api_key="test-key",
+                prompts=prompts1,
+            )
 
-                # Version 3
-                local_path.write_text(create_prompts_markdown(ad_prompt=prompt_v3))
-                prompts3 = load_prompts(
-                    local_path=local_path,
-                    global_path=global_path,
-                    warn_on_fallback=False,
-                )
-                detect_advertisements(
-                    text="Test",
-                    api_key="test-key",
-                    prompts=prompts3,
-                )
+            # Version 2
+            local_path.write_text(create_prompts_markdown(ad_prompt=prompt_v2))
+            prompts2 = load_prompts(
+                local_path=local_path,
+                global_path=global_path,
+                warn_on_fallback=False,
+            )
+            detect_advertisements(
+                text="Test",
+                api_key="test-key",
+                prompts=prompts2,
+            )
 
-                # Property: Each call SHALL use the corresponding version
-                assert len(api_calls) == 3
-                assert prompt_v1 in api_calls[0], "First call should use v1 prompt"
-                assert prompt_v2 in api_calls[1], "Second call should use v2 prompt"
-                assert prompt_v3 in api_calls[2], "Third call should use v3 prompt"
-        finally:
-            import shutil
+            # Version 3
+            local_path.write_text(create_prompts_markdown(ad_prompt=prompt_v3))
+            prompts3 = load_prompts(
+                local_path=local_path,
+                global_path=global_path,
+                warn_on_fallback=False,
+            )
+            detect_advertisements(
+                text="Test",
+                api_key="test-key",
+                prompts=prompts3,
+            )
 
-            shutil.rmtree(base_dir, ignore_errors=True)
+            # Property: Each call SHALL use the corresponding version
+            assert len(api_calls) == 3
+            assert prompt_v1 in api_calls[0], "First call should use v1 prompt"
+            assert prompt_v2 in api_calls[1], "Second call should use v2 prompt"
+            assert prompt_v3 in api_calls[2], "Third call should use v3 prompt"
 
     @settings(max_examples=100)
     @given(
@@ -466,6 +448,7 @@ class TestPromptRuntimeLoading:
     )
     def test_load_prompts_reads_file_each_time(
         self,
+        prompts_dir: Path,
         initial_prompt: str,
         updated_prompt: str,
     ) -> None:
@@ -481,52 +464,42 @@ class TestPromptRuntimeLoading:
         # Ensure prompts are different
         assume(initial_prompt.strip() != updated_prompt.strip())
 
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        prompts_dir = base_dir / f"prompts_{unique_id}"
-        prompts_dir.mkdir(parents=True)
-
         local_path = prompts_dir / "prompts.md"
         global_path = prompts_dir / "global_prompts.md"
 
-        try:
-            # Write initial prompts
-            local_path.write_text(create_prompts_markdown(ad_prompt=initial_prompt))
+        # Write initial prompts
+        local_path.write_text(create_prompts_markdown(ad_prompt=initial_prompt))
 
-            # Load prompts - should get initial content
-            prompts1 = load_prompts(
-                local_path=local_path,
-                global_path=global_path,
-                warn_on_fallback=False,
-            )
-            assert prompts1.advertisement_detection == initial_prompt, (
-                "First load should return initial prompt"
-            )
-
-            # Update the file
-            local_path.write_text(create_prompts_markdown(ad_prompt=updated_prompt))
+        # Load prompts - should get initial content
+        prompts1 = load_prompts(
+            local_path=local_path,
+            global_path=global_path,
+            warn_on_fallback=False,
+        )
+        assert prompts1.advertisement_detection == initial_prompt, (
+            "First load should return initial prompt"
+        )
 
-            # Load prompts again - should get updated content
-            prompts2 = load_prompts(
-                local_path=local_path,
-                global_path=global_path,
-                warn_on_fallback=False,
-            )
+        # Update the file
+        local_path.write_text(create_prompts_markdown(ad_prompt=updated_prompt))
 
-            # Property: load_prompts SHALL return updated content
-            assert prompts2.advertisement_detection == updated_prompt, (
-                f"Second load should return updated prompt '{updated_prompt[:50]}...', "
-                f"but got '{prompts2.advertisement_detection[:50]}...'"
-            )
+        # Load prompts again - should get updated content
+        prompts2 = load_prompts(
+            local_path=local_path,
+            global_path=global_path,
+            warn_on_fallback=False,
+        )
 
-            # Verify the prompts are different
-            assert prompts1.advertisement_detection != prompts2.advertisement_detection, (
-                "Prompts should be different after file update"
-            )
-        finally:
-            import shutil
+        # Property: load_prompts SHALL return updated content
+        assert prompts2.advertisement_detection == updated_prompt, (
+            f"Second load should return updated prompt '{updated_prompt[:50]}...', "
+            f"but got '{prompts2.advertisement_detection[:50]}...'"
+        )
 
-            shutil.rmtree(base_dir, ignore_errors=True)
+        # Verify the prompts are different
+        assert prompts1.advertisement_detection != prompts2.advertisement_detection, (
+            "Prompts should be different after file update"
+        )
 
     @settings(max_examples=100)
     @given(
@@ -537,6 +510,7 @@ class TestPromptRuntimeLoading:
     )
     def test_all_prompt_sections_loaded_at_runtime(
         self,
+        prompts_dir: Path,
         ad_prompt: str,
         summary_prompt: str,
         topic_prompt: str,
@@ -551,49 +525,40 @@ class TestPromptRuntimeLoading:
 
         **Validates: Requirements 9.2**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        prompts_dir = base_dir / f"prompts_{unique_id}"
-        prompts_dir.mkdir(parents=True)
 
         local_path = prompts_dir / "prompts.md"
         global_path = prompts_dir / "global_prompts.md"
 
-        try:
-            # Write prompts file with all sections
-            local_path.write_text(
-                create_prompts_markdown(
-                    ad_prompt=ad_prompt,
-                    summary_prompt=summary_prompt,
-                    topic_prompt=topic_prompt,
-                    keyword_prompt=keyword_prompt,
-                )
-            )
-
-            # Load prompts
-            prompts = load_prompts(
-                local_path=local_path,
-                global_path=global_path,
-                warn_on_fallback=False,
+        # Write prompts file with all sections
+        local_path.write_text(
+            create_prompts_markdown(
+                ad_prompt=ad_prompt,
+                summary_prompt=summary_prompt,
+                topic_prompt=topic_prompt,
+                keyword_prompt=keyword_prompt,
             )
+        )
 
-            # Property: All sections SHALL be loaded from file
-            assert prompts.advertisement_detection == ad_prompt, (
-                "Advertisement detection prompt should match file content"
-            )
-            assert prompts.content_summary == summary_prompt, (
-                "Content summary prompt should match file content"
-            )
-            assert prompts.topic_extraction == topic_prompt, (
-                "Topic extraction prompt should match file content"
-            )
-            assert prompts.keyword_extraction == keyword_prompt, (
-                "Keyword extraction prompt should match file content"
-            )
-        finally:
-            import shutil
+        # Load prompts
+        prompts = load_prompts(
+            local_path=local_path,
+            global_path=global_path,
+            warn_on_fallback=False,
+        )
 
-            shutil.rmtree(base_dir, ignore_errors=True)
+        # Property: All sections SHALL be loaded from file
+        assert prompts.advertisement_detection == ad_prompt, (
+            "Advertisement detection prompt should match file content"
+        )
+        assert prompts.content_summary == summary_prompt, (
+            "Content summary prompt should match file content"
+        )
+        assert prompts.topic_extraction == topic_prompt, (
+            "Topic extraction prompt should match file content"
+        )
+        assert prompts.keyword_extraction == keyword_prompt, (
+            "Keyword extraction prompt should match file content"
+        )
 
     @settings(max_examples=100)
     @given(
@@ -601,6 +566,7 @@ class TestPromptRuntimeLoading:
     )
     def test_deleted_file_falls_back_to_defaults(
         self,
+        prompts_dir: Path,
         initial_prompt: str,
     ) -> None:
         """Property 13: Prompt Runtime Loading - File Deletion
@@ -612,53 +578,44 @@ class TestPromptRuntimeLoading:
 
         **Validates: Requirements 9.2, 9.3**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        prompts_dir = base_dir / f"prompts_{unique_id}"
-        prompts_dir.mkdir(parents=True)
 
         local_path = prompts_dir / "prompts.md"
         global_path = prompts_dir / "global_prompts.md"
 
-        try:
-            # Write initial prompts file
-            local_path.write_text(create_prompts_markdown(ad_prompt=initial_prompt))
-
-            # Load prompts - should get custom content
-            prompts1 = load_prompts(
-                local_path=local_path,
-                global_path=global_path,
-                warn_on_fallback=False,
-            )
-            assert prompts1.advertisement_detection == initial_prompt
+        # Write initial prompts file
+        local_path.write_text(create_prompts_markdown(ad_prompt=initial_prompt))
 
-            # Delete the file
-            local_path.unlink()
+        # Load prompts - should get custom content
+        prompts1 = load_prompts(
+            local_path=local_path,
+            global_path=global_path,
+            warn_on_fallback=False,
+        )
+        assert prompts1.advertisement_detection == initial_prompt
 
-            # Load prompts again - should fall back to defaults
-            prompts2 = load_prompts(
-                local_path=local_path,
-                global_path=global_path,
-                warn_on_fallback=False,
-            )
+        # Delete the file
+        local_path.unlink()
 
-            # Property: After deletion, SHALL use built-in defaults
-            assert prompts2.advertisement_detection == DEFAULT_ADVERTISEMENT_DETECTION_PROMPT, (
-                "After file deletion, should use default advertisement detection prompt"
-            )
-            assert prompts2.content_summary == DEFAULT_CONTENT_SUMMARY_PROMPT, (
-                "After file deletion, should use default content summary prompt"
-            )
-            assert prompts2.topic_extraction == DEFAULT_TOPIC_EXTRACTION_PROMPT, (
-                "After file deletion, should use default topic extraction prompt"
-            )
-            assert prompts2.keyword_extraction == DEFAULT_KEYWORD_EXTRACTION_PROMPT, (
-                "After file deletion, should use default keyword extraction prompt"
-            )
-        finally:
-            import shutil
+        # Load prompts again - should fall back to defaults
+        prompts2 = load_prompts(
+            local_path=local_path,
+            global_path=global_path,
+            warn_on_fallback=False,
+        )
 
-            shutil.rmtree(base_dir, ignore_errors=True)
+        # Property: After deletion, SHALL use built-in defaults
+        assert prompts2.advertisement_detection == DEFAULT_ADVERTISEMENT_DETECTION_PROMPT, (
+            "After file deletion, should use default advertisement detection prompt"
+        )
+        assert prompts2.content_summary == DEFAULT_CONTENT_SUMMARY_PROMPT, (
+            "After file deletion, should use default content summary prompt"
+        )
+        assert prompts2.topic_extraction == DEFAULT_TOPIC_EXTRACTION_PROMPT, (
+            "After file deletion, should use default topic extraction prompt"
+        )
+        assert prompts2.keyword_extraction == DEFAULT_KEYWORD_EXTRACTION_PROMPT, (
+            "After file deletion, should use default keyword extraction prompt"
+        )
 
     @settings(max_examples=100)
     @given(
@@ -667,6 +624,7 @@ class TestPromptRuntimeLoading:
     )
     def test_partial_update_reflects_in_api_calls(
         self,
+        prompts_dir: Path,
         prompt_content: str,
         section: str,
     ) -> None:
@@ -679,50 +637,35 @@ class TestPromptRuntimeLoading:
 
         **Validates: Requirements 9.2**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        prompts_dir = base_dir / f"prompts_{unique_id}"
-        prompts_dir.mkdir(parents=True)
 
         local_path = prompts_dir / "prompts.md"
         global_path = prompts_dir / "global_prompts.md"
 
-        try:
-            # Create prompts with the specified section updated
-            kwargs = {
-                "ad_prompt": "Default ad"
-                if section != "advertisement_detection"
-                else prompt_content,
-                "summary_prompt": "Default summary"
-                if section != "content_summary"
-                else prompt_content,
-                "topic_prompt": "Default topic"
-                if section != "topic_extraction"
-                else prompt_content,
-                "keyword_prompt": "Default keyword"
-                if section != "keyword_extraction"
-                else prompt_content,
-            }
-
-            local_path.write_text(create_prompts_markdown(**kwargs))
-
-            # Load prompts
-            prompts = load_prompts(
-                local_path=local_path,
-                global_path=global_path,
-                warn_on_fallback=False,
-            )
+        # Create prompts with the specified section updated
+        kwargs = {
+            "ad_prompt": "Default ad" if section != "advertisement_detection" else prompt_content,
+            "summary_prompt": "Default summary" if section != "content_summary" else prompt_content,
+            "topic_prompt": "Default topic" if section != "topic_extraction" else prompt_content,
+            "keyword_prompt": "Default keyword"
+            if section != "keyword_extraction"
+            else prompt_content,
+        }
+
+        local_path.write_text(create_prompts_markdown(**kwargs))
+
+        # Load prompts
+        prompts = load_prompts(
+            local_path=local_path,
+            global_path=global_path,
+            warn_on_fallback=False,
+        )
 
-            # Property: The updated section SHALL contain the new content
-            if section == "advertisement_detection":
-                assert prompts.advertisement_detection == prompt_content
-            elif section == "content_summary":
-                assert prompts.content_summary == prompt_content
-            elif section == "topic_extraction":
-                assert prompts.topic_extraction == prompt_content
-            elif section == "keyword_extraction":
-                assert prompts.keyword_extraction == prompt_content
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
+        # Property: The updated section SHALL contain the new content
+        if section == "advertisement_detection":
+            assert prompts.advertisement_detection == prompt_content
+        elif section == "content_summary":
+            assert prompts.content_summary == prompt_content
+        elif section == "topic_extraction":
+            assert prompts.topic_extraction == prompt_content
+        elif section == "keyword_extraction":
+            assert prompts.keyword_extraction == prompt_content
@@ -9,8 +9,8 @@ Validates: Requirements 8.1, 8.2, 8.5
 from __future__ import annotations
 
 import os
+import shutil
 import tempfile
-import uuid
 from pathlib import Path
 from typing import Any
 
@@ -27,7 +27,7 @@ from podtext.core.config import (
 # =============================================================================
 
 # Strategy for valid whisper model names
-whisper_model_strategy = st.sampled_from(list(VALID_WHISPER_MODELS))
+whisper_model_strategy = st.sampled_from(sorted(VALID_WHISPER_MODELS))
 
 # TOML-safe printable ASCII characters (excluding control chars and problematic chars)
 # TOML basic strings allow: printable ASCII except backslash and quote (which need escaping)
@@ -101,9 +101,8 @@ def create_temp_config_dirs() -> tuple[Path, Path, Path]:
         Tuple of (base_dir, local_path, global_path)
     """
     base_dir = Path(tempfile.mkdtemp())
-    unique_id = str(uuid.uuid4())[:8]
-    local_dir = base_dir / f"local_{unique_id}"
-    global_dir = base_dir / f"global_{unique_id}"
+    local_dir = base_dir / "local"
+    global_dir = base_dir / "global"
     local_dir.mkdir(parents=True)
     global_dir.mkdir(parents=True)
     return base_dir, local_dir / "config", global_dir / "config"
@@ -195,8 +194,6 @@ class TestConfigLoadingPriority:
                 )
             finally:
                 # Cleanup temp directory
-                import shutil
-
                 shutil.rmtree(base_dir, ignore_errors=True)
         finally:
             if original_env is not None:
@@ -242,8 +239,6 @@ class TestConfigLoadingPriority:
                     f"but got '{config.whisper.model}'"
                 )
             finally:
-                import shutil
-
                 shutil.rmtree(base_dir, ignore_errors=True)
         finally:
             if original_env is not None:
@@ -288,8 +283,6 @@ class TestConfigLoadingPriority:
                     f"but got '{config.storage.temp_storage}'"
                 )
             finally:
-                import shutil
-
                 shutil.rmtree(base_dir, ignore_errors=True)
         finally:
             if original_env is not None:
@@ -359,8 +352,6 @@ class TestEnvironmentVariablePrecedence:
                     f"but got '{actual_key}' (config value was '{config_value}')"
                 )
             finally:
-                import shutil
-
                 shutil.rmtree(base_dir, ignore_errors=True)
         finally:
             if original_env is not None:
@@ -421,8 +412,6 @@ class TestEnvironmentVariablePrecedence:
                     f"global config: '{global_config_value}')"
                 )
             finally:
-                import shutil
-
                 shutil.rmtree(base_dir, ignore_errors=True)
         finally:
             if original_env is not None:
@@ -452,9 +441,8 @@ class TestEnvironmentVariablePrecedence:
         original_env = os.environ.get("ANTHROPIC_API_KEY")
         try:
             base_dir = Path(tempfile.mkdtemp())
-            unique_id = str(uuid.uuid4())[:8]
-            local_path = base_dir / f"nonexistent_local_{unique_id}" / "config"
-            global_path = base_dir / f"nonexistent_global_{unique_id}" / "config"
+            local_path = base_dir / "nonexistent_local" / "config"
+            global_path = base_dir / "nonexistent_global" / "config"
 
             try:
                 # Set the environment variable
@@ -473,8 +461,6 @@ class TestEnvironmentVariablePrecedence:
                     f"but got '{actual_key}'"
                 )
             finally:
-                import shutil
-
                 shutil.rmtree(base_dir, ignore_errors=True)
         finally:
             if original_env is not None:
@@ -523,8 +509,6 @@ class TestEnvironmentVariablePrecedence:
                     f"but got '{actual_key}'"
                 )
             finally:
-                import shutil
-
                 shutil.rmtree(base_dir, ignore_errors=True)
         finally:
             if original_env is not None:
@@ -12,6 +12,7 @@ from hypothesis import strategies as st
 from podtext.core.output import _format_frontmatter
 from podtext.services.claude import AnalysisResult
 from podtext.services.rss import EpisodeInfo
+from yaml_helpers import YAML_LOADER
 
 # Strategy for generating valid URLs
 url_strategy = st.text(
@@ -47,9 +48,8 @@ def test_feed_url_round_trip(feed_url: str, media_url: str) -> None:
 
     frontmatter = _format_frontmatter(episode, analysis)
 
-    # Parse the YAML content (strip the --- delimiters)
-    yaml_content = frontmatter.strip().strip("-").strip()
-    parsed = yaml.safe_load(yaml_content)
+    # libyaml handles the --- delimiters
+    parsed = next(yaml.load_all(frontmatter, Loader=YAML_LOADER))
 
     assert parsed["feed_url"] == feed_url
 
@@ -74,9 +74,8 @@ def test_media_url_round_trip(media_url: str) -> None:
 
     frontmatter = _format_frontmatter(episode, analysis)
 
-    # Parse the YAML content
-    yaml_content = frontmatter.strip().strip("-").strip()
-    parsed = yaml.safe_load(yaml_content)
+    # libyaml handles the --- delimiters
+    parsed = next(yaml.load_all(frontmatter, Loader=YAML_LOADER))
 
     assert parsed["media_url"] == media_url
 
@@ -156,28 +155,27 @@ def test_existing_fields_preserved(
 
     frontmatter = _format_frontmatter(episode, analysis, podcast_name)
 
-    # Parse the YAML content
-    yaml_content = frontmatter.strip().strip("-").strip()
-    parsed = yaml.safe_load(yaml_content)
+    # libyaml handles the --- delimiters
+    parsed = next(yaml.load_all(frontmatter, Loader=YAML_LOADER))
 
-    # Required fields always present
-    assert "title" in parsed
-    assert "pub_date" in parsed
-    assert "media_url" in parsed
-
-    # Conditional fields
+    # Required fields always present, conditional fields only when provided
+    expected: dict[str, str | list[str]] = {
+        "pub_date": "2024-01-15",
+        "media_url": episode.media_url,
+    }
     if podcast_name:
-        assert parsed.get("podcast") == podcast_name
+        expected["podcast"] = podcast_name
+    if topics:
+        expected["topics"] = topics
+    if keywords:
+        expected["keywords"] = keywords
+
+    assert "title" in parsed
+    assert expected.items() <= parsed.items()
 
     # Summary is no longer in frontmatter (moved to main content)
     assert "summary" not in parsed
 
-    if topics:
-        assert parsed.get("topics") == topics
-
-    if keywords:
-        assert parsed.get("keywords") == keywords
-
 
 def test_feed_url_omitted_when_none() -> None:
     """Test that feed_url is omitted from frontmatter when None."""
@@ -192,9 +190,8 @@ def test_feed_url_omitted_when_none() -> None:
 
     frontmatter = _format_frontmatter(episode, analysis)
 
-    # Parse the YAML content
-    yaml_content = frontmatter.strip().strip("-").strip()
-    parsed = yaml.safe_load(yaml_content)
+    # libyaml handles the --- delimiters
+    parsed = next(yaml.load_all(frontmatter, Loader=YAML_LOADER))
 
     assert "feed_url" not in parsed
     assert "media_url" in parsed  # media_url should always be present
@@ -212,8 +209,8 @@ def test_media_url_always_present() -> None:
 
     frontmatter = _format_frontmatter(episode, analysis)
 
-    yaml_content = frontmatter.strip().strip("-").strip()
-    parsed = yaml.safe_load(yaml_content)
+    # libyaml handles the --- delimiters
+    parsed = next(yaml.load_all(frontmatter, Loader=YAML_LOADER))
 
     assert "media_url" in parsed
     assert parsed["media_url"] == "https://example.com/episode.mp3"
@@ -29,7 +29,7 @@ from podtext.core.pipeline import (
 from podtext.services.claude import AnalysisResult
 from podtext.services.downloader import DownloadError
 from podtext.services.itunes import ITunesAPIError, PodcastSearchResult
-from podtext.services.rss import EpisodeInfo, RSSFeedError
+from podtext.services.rss import EpisodeInfo, FeedInfo, RSSFeedError
 from podtext.services.transcriber import TranscriptionError, TranscriptionResult
 
 # ============================================================================
@@ -58,7 +58,7 @@ def clean_env() -> Generator[None]:
         os.environ["ANTHROPIC_API_KEY"] = original
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_episode() -> EpisodeInfo:
     """Create a sample episode for testing."""
     return EpisodeInfo(
@@ -69,7 +69,7 @@ def sample_episode() -> EpisodeInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_transcription() -> TranscriptionResult:
     """Create a sample transcription result for testing."""
     return TranscriptionResult(
@@ -83,7 +83,7 @@ def sample_transcription() -> TranscriptionResult:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_analysis() -> AnalysisResult:
     """Create a sample analysis result for testing."""
     return AnalysisResult(
@@ -572,8 +572,6 @@ class TestCLIEpisodesCommand:
     @patch("podtext.cli.main.parse_feed")
     def test_episodes_command_success(self, mock_parse: MagicMock, runner: CliRunner) -> None:
         """Test successful episodes command execution."""
-        from podtext.services.rss import FeedInfo
-        
         mock_parse.return_value = FeedInfo(
             title="Test Podcast",
             episodes=[
@@ -602,8 +600,6 @@ class TestCLIEpisodesCommand:
     @patch("podtext.cli.main.parse_feed")
     def test_episodes_command_with_limit(self, mock_parse: MagicMock, runner: CliRunner) -> None:
         """Test episodes command with custom limit."""
-        from podtext.services.rss import FeedInfo
-        
         mock_parse.return_value = FeedInfo(title="Test Podcast", episodes=[])
 
         result = runner.invoke(cli, ["episodes", "https://example.com/feed.xml", "--limit", "5"])
@@ -624,8 +620,6 @@ class TestCLIEpisodesCommand:
     @patch("podtext.cli.main.parse_feed")
     def test_episodes_command_no_episodes(self, mock_parse: MagicMock, runner: CliRunner) -> None:
         """Test episodes command with no episodes."""
-        from podtext.services.rss import FeedInfo
-        
         mock_parse.return_value = FeedInfo(title="Test Podcast", episodes=[])
 
         result = runner.invoke(cli, ["episodes", "https://example.com/feed.xml"])
@@ -653,8 +647,6 @@ class TestCLITranscribeCommand:
         tmp_path: Path,
     ) -> None:
         """Test successful transcribe command execution."""
-        from podtext.services.rss import FeedInfo
-        
         # Setup mocks
         mock_load_config.return_value = sample_config
         mock_parse.return_value = FeedInfo(
@@ -691,8 +683,6 @@ class TestCLITranscribeCommand:
         sample_config: Config,
     ) -> None:
         """Test transcribe command with invalid episode index."""
-        from podtext.services.rss import FeedInfo
-        
         mock_load_config.return_value = sample_config
         mock_parse.return_value = FeedInfo(
             title="Test Podcast",
@@ -724,8 +714,6 @@ class TestCLITranscribeCommand:
         sample_config: Config,
     ) -> None:
         """Test transcribe command handles download errors gracefully."""
-        from podtext.services.rss import FeedInfo
-        
         mock_load_config.return_value = sample_config
         mock_parse.return_value = FeedInfo(
             title="Test Podcast",
@@ -760,8 +748,6 @@ class TestCLITranscribeCommand:
         tmp_path: Path,
     ) -> None:
         """Test transcribe command handles transcription errors gracefully."""
-        from podtext.services.rss import FeedInfo
-        
         mock_load_config.return_value = sample_config
         mock_parse.return_value = FeedInfo(
             title="Test Podcast",
@@ -2,19 +2,23 @@
 
 Feature: podtext
 Tests media storage location, temporary file cleanup, config model propagation,
-and language check bypass.
+language check bypass, and paragraph extraction.
 
-Validates: Requirements 3.2, 3.3, 4.2, 5.3
+Validates: Requirements 3.2, 3.3, 4.2, 4.3, 5.3
 """
 
 from __future__ import annotations
 
-import tempfile
-import uuid
+import itertools
+import string
+from collections.abc import Generator
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, patch
 
-from hypothesis import assume, given, settings
+import pytest
+from hypothesis import example, given
 from hypothesis import strategies as st
 
 from podtext.core.config import (
@@ -30,28 +34,66 @@ from podtext.services.downloader import (
 )
 from podtext.services.transcriber import (
     TranscriptionResult,
+    _detect_language,
+    _extract_paragraphs,
     transcribe,
     transcribe_with_config,
 )
 
+# =============================================================================
+# Shared test data
+# =============================================================================
+
+# Payload streamed by the mocked download and written to fake audio files
+FAKE_AUDIO_CONTENT = b"fake audio content for testing"
+
+# Audio path handed to transcribe(); it is never opened because mlx_whisper is
+# mocked and the existence check is patched out
+FAKE_AUDIO_PATH = Path("fake.mp3")
+
+# mlx_whisper.transcribe() result template; the mlx_mock fixture hands each
+# class its own copy, which the language tests overwrite per example
+FAKE_WHISPER_RESULT = {
+    "text": "Test transcription",
+    "segments": [{"text": "Test transcription."}],
+    "language": "en",
+}
+
+# Stand-in for the mlx_whisper module, installed by the mlx_mock fixture; one
+# mock is reset between tests instead of patching in a fresh one each time
+MLX_MOCK = MagicMock()
+
+# Result returned by the mocked transcribe() when testing transcribe_with_config
+FAKE_TRANSCRIPTION_RESULT = TranscriptionResult(
+    text="Test",
+    paragraphs=["Test."],
+    language="en",
+)
+
+
 # =============================================================================
 # Strategies for generating test data
 # =============================================================================
 
-# Strategy for valid whisper model names
-whisper_model_strategy = st.sampled_from(list(VALID_WHISPER_MODELS))
+# Valid whisper model names; the set is small enough to test exhaustively with
+# pytest.mark.parametrize instead of drawing from it with Hypothesis
+WHISPER_MODELS = sorted(VALID_WHISPER_MODELS)
+WHISPER_MODEL_PAIRS = list(itertools.combinations(WHISPER_MODELS, 2))
+
+# Substring each model's Hugging Face repo path must contain
+WHISPER_REPO_MARKERS = {model: f"whisper-{model}" for model in WHISPER_MODELS}
+
+# Precomputed pools of valid path components; sampling from a list is cheaper
+# than building names character by character and never needs rejection
+_MEDIA_EXTENSIONS = ["mp3", "m4a", "wav", "ogg", "mp4"]
+_DIR_POOL = [f"d{i:03d}" for i in range(200)]
+_FILE_POOL = [f"f{i:03d}.{_MEDIA_EXTENSIONS[i % len(_MEDIA_EXTENSIONS)]}" for i in range(200)]
 
 # Strategy for valid directory names (simple alphanumeric)
-dir_name_strategy = st.from_regex(
-    r"[a-zA-Z][a-zA-Z0-9_-]{0,20}",
-    fullmatch=True,
-)
+dir_name_strategy = st.sampled_from(_DIR_POOL)
 
 # Strategy for valid filenames (simple alphanumeric with extension)
-filename_strategy = st.from_regex(
-    r"[a-zA-Z][a-zA-Z0-9_-]{0,15}\.(mp3|m4a|wav|ogg|mp4)",
-    fullmatch=True,
-)
+filename_strategy = st.sampled_from(_FILE_POOL)
 
 
 # Strategy for generating nested directory paths
@@ -67,8 +109,10 @@ def nested_path_strategy(draw: st.DrawFn) -> str:
 @st.composite
 def media_url_strategy(draw: st.DrawFn) -> str:
     """Generate a valid media URL."""
-    domain = draw(st.from_regex(r"[a-z]{3,10}", fullmatch=True))
-    path = draw(st.from_regex(r"[a-z0-9/]{1,20}", fullmatch=True))
+    domain = draw(st.text(alphabet=string.ascii_lowercase, min_size=3, max_size=10))
+    path = draw(
+        st.text(alphabet=string.ascii_lowercase + string.digits + "/", min_size=1, max_size=20)
+    )
     filename = draw(filename_strategy)
     return f"https://{domain}.com/{path}/{filename}"
 
@@ -84,6 +128,52 @@ language_code_strategy = st.sampled_from(
 # =============================================================================
 
 
+@pytest.fixture(scope="module")
+def base_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide one temp directory per module; pytest removes it after the session."""
+    return tmp_path_factory.mktemp("media")
+
+
+@pytest.fixture(scope="module")
+def fake_audio_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write one fake audio file shared by every transcription example."""
+    path = tmp_path_factory.mktemp("audio") / FAKE_AUDIO_PATH.name
+    path.write_bytes(FAKE_AUDIO_CONTENT)
+    return path
+
+
+@pytest.fixture(scope="class")
+def shared_config() -> Config:
+    """Provide one Config per class; examples overwrite the storage fields they use."""
+    return Config(storage=StorageConfig())
+
+
+@pytest.fixture(scope="class")
+def mock_stream() -> Generator[MagicMock]:
+    """Patch httpx.stream once per class with a reusable streaming response."""
+    with patch("podtext.services.downloader.httpx.stream") as stream:
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.__exit__.return_value = False
+        stream.return_value = response
+        yield stream
+
+
+@pytest.fixture(scope="class")
+def mlx_mock() -> Generator[MagicMock]:
+    """Install MLX_MOCK as mlx_whisper for a whole class.
+
+    Each class gets its own copy of FAKE_WHISPER_RESULT as the transcription
+    result, so tests may overwrite its keys.
+    """
+    MLX_MOCK.reset_mock()
+    MLX_MOCK.transcribe.return_value = dict(FAKE_WHISPER_RESULT)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("podtext.services.transcriber.MLX_WHISPER_AVAILABLE", True)
+        mp.setattr("podtext.services.transcriber.mlx_whisper", MLX_MOCK)
+        yield MLX_MOCK
+
+
 class TestMediaStorageLocation:
     """Property 5: Media Storage Location
 
@@ -95,13 +185,16 @@ class TestMediaStorageLocation:
     **Validates: Requirements 3.2**
     """
 
-    @settings(max_examples=100)
     @given(
         subdir=nested_path_strategy(),
         filename=filename_strategy,
     )
+    @example(subdir="a", filename="x.mp3")
     def test_downloaded_file_stored_in_config_media_dir(
         self,
+        base_dir: Path,
+        shared_config: Config,
+        mock_stream: MagicMock,
         subdir: str,
         filename: str,
     ) -> None:
@@ -114,65 +207,51 @@ class TestMediaStorageLocation:
 
         **Validates: Requirements 3.2**
         """
-        # Create a unique temp directory for this test
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        media_dir = base_dir / f"media_{unique_id}" / subdir
-
-        try:
-            # Create config with the generated media_dir path
-            config = Config(storage=StorageConfig(media_dir=str(media_dir)))
-
-            # Mock the HTTP download to avoid network calls
-            test_content = b"fake audio content for testing"
-
-            with patch("podtext.services.downloader.httpx.stream") as mock_stream:
-                mock_response = MagicMock()
-                mock_response.iter_bytes.return_value = [test_content]
-                mock_response.raise_for_status = MagicMock()
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
-                mock_stream.return_value = mock_response
-
-                # Download media to config directory
-                result_path = download_media_to_config_dir(
-                    f"https://example.com/podcast/{filename}",
-                    config,
-                    filename=filename,
-                )
-
-                # Property: Downloaded file SHALL be stored within path P (media_dir)
-                assert result_path.exists(), f"Downloaded file should exist at {result_path}"
-
-                # Verify the file is within the configured media_dir
-                assert str(result_path).startswith(str(media_dir)), (
-                    f"Downloaded file '{result_path}' should be within "
-                    f"configured media_dir '{media_dir}'"
-                )
-
-                # Verify the file is a direct child of media_dir
-                assert result_path.parent == media_dir, (
-                    f"Downloaded file parent '{result_path.parent}' should be "
-                    f"exactly the configured media_dir '{media_dir}'"
-                )
-
-                # Verify the content was written correctly
-                assert result_path.read_bytes() == test_content, (
-                    "Downloaded file content should match expected content"
-                )
-        finally:
-            # Cleanup
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
-
-    @settings(max_examples=100)
+        # Downloads overwrite, so examples that draw the same path can share it
+        media_dir = base_dir / "stored" / subdir
+
+        # Point the config at the generated media_dir path
+        config = shared_config
+        config.storage.media_dir = str(media_dir)
+
+        # Mock the HTTP download to avoid network calls
+        mock_stream.return_value.iter_bytes.return_value = [FAKE_AUDIO_CONTENT]
+
+        # Download media to config directory
+        result_path = download_media_to_config_dir(
+            f"https://example.com/podcast/{filename}",
+            config,
+            filename=filename,
+        )
+
+        # Property: Downloaded file SHALL be stored within path P (media_dir)
+        assert result_path.exists(), f"Downloaded file should exist at {result_path}"
+
+        # Verify the file is within the configured media_dir
+        assert str(result_path).startswith(str(media_dir)), (
+            f"Downloaded file '{result_path}' should be within configured media_dir '{media_dir}'"
+        )
+
+        # Verify the file is a direct child of media_dir
+        assert result_path.parent == media_dir, (
+            f"Downloaded file parent '{result_path.parent}' should be "
+            f"exactly the configured media_dir '{media_dir}'"
+        )
+
+        # Verify the content was written correctly
+        assert result_path.read_bytes() == FAKE_AUDIO_CONTENT, (
+            "Downloaded file content should match expected content"
+        )
+
     @given(
         media_dir_name=dir_name_strategy,
         filename=filename_strategy,
     )
+    @example(media_dir_name="a", filename="x.mp3")
     def test_download_media_respects_dest_path(
         self,
+        base_dir: Path,
+        mock_stream: MagicMock,
         media_dir_name: str,
         filename: str,
     ) -> None:
@@ -185,35 +264,20 @@ class TestMediaStorageLocation:
 
         **Validates: Requirements 3.2**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        dest_path = base_dir / f"{media_dir_name}_{unique_id}" / filename
+        dest_path = base_dir / "dest" / media_dir_name / filename
 
-        try:
-            test_content = b"test audio data"
+        mock_stream.return_value.iter_bytes.return_value = [FAKE_AUDIO_CONTENT]
 
-            with patch("podtext.services.downloader.httpx.stream") as mock_stream:
-                mock_response = MagicMock()
-                mock_response.iter_bytes.return_value = [test_content]
-                mock_response.raise_for_status = MagicMock()
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
-                mock_stream.return_value = mock_response
+        result_path = download_media(
+            f"https://example.com/{filename}",
+            dest_path,
+        )
 
-                result_path = download_media(
-                    f"https://example.com/{filename}",
-                    dest_path,
-                )
-
-                # Property: Downloaded file SHALL be stored at exactly the specified path
-                assert result_path == dest_path, (
-                    f"Returned path '{result_path}' should equal destination path '{dest_path}'"
-                )
-                assert dest_path.exists(), f"File should exist at destination path '{dest_path}'"
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
+        # Property: Downloaded file SHALL be stored at exactly the specified path
+        assert result_path == dest_path, (
+            f"Returned path '{result_path}' should equal destination path '{dest_path}'"
+        )
+        assert dest_path.exists(), f"File should exist at destination path '{dest_path}'"
 
 
 # =============================================================================
@@ -232,13 +296,15 @@ class TestTemporaryFileCleanup:
     **Validates: Requirements 3.3**
     """
 
-    @settings(max_examples=100)
     @given(
         filename=filename_strategy,
         subdir=dir_name_strategy,
     )
     def test_media_file_deleted_after_context_exit_with_temp_storage(
         self,
+        base_dir: Path,
+        shared_config: Config,
+        mock_stream: MagicMock,
         filename: str,
         subdir: str,
     ) -> None:
@@ -251,57 +317,41 @@ class TestTemporaryFileCleanup:
 
         **Validates: Requirements 3.3**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        media_dir = base_dir / f"media_{unique_id}" / subdir
-
-        try:
-            # Create config with temp_storage=True
-            config = Config(
-                storage=StorageConfig(
-                    media_dir=str(media_dir),
-                    temp_storage=True,  # Key: temp_storage is enabled
-                )
-            )
+        media_dir = base_dir / "temp" / subdir
+
+        # Point the config at media_dir with temp_storage=True
+        config = shared_config
+        config.storage.media_dir = str(media_dir)
+        config.storage.temp_storage = True  # Key: temp_storage is enabled
+
+        mock_stream.return_value.iter_bytes.return_value = [FAKE_AUDIO_CONTENT]
+
+        # Use the context manager that respects temp_storage config
+        file_path_during_context = None
+        with download_with_optional_cleanup(
+            f"https://example.com/{filename}",
+            config,
+            filename=filename,
+        ) as file_path:
+            file_path_during_context = file_path
+            # File should exist during the context
+            assert file_path.exists(), f"File should exist during context at '{file_path}'"
+
+        # Property: After completion, media file SHALL not exist on disk
+        assert not file_path_during_context.exists(), (
+            f"With temp_storage=True, file '{file_path_during_context}' "
+            "should NOT exist after context exit"
+        )
 
-            test_content = b"temporary audio content"
-
-            with patch("podtext.services.downloader.httpx.stream") as mock_stream:
-                mock_response = MagicMock()
-                mock_response.iter_bytes.return_value = [test_content]
-                mock_response.raise_for_status = MagicMock()
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
-                mock_stream.return_value = mock_response
-
-                # Use the context manager that respects temp_storage config
-                file_path_during_context = None
-                with download_with_optional_cleanup(
-                    f"https://example.com/{filename}",
-                    config,
-                    filename=filename,
-                ) as file_path:
-                    file_path_during_context = file_path
-                    # File should exist during the context
-                    assert file_path.exists(), f"File should exist during context at '{file_path}'"
-
-                # Property: After completion, media file SHALL not exist on disk
-                assert not file_path_during_context.exists(), (
-                    f"With temp_storage=True, file '{file_path_during_context}' "
-                    "should NOT exist after context exit"
-                )
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
-
-    @settings(max_examples=100)
     @given(
         filename=filename_strategy,
         subdir=dir_name_strategy,
     )
     def test_media_file_persists_when_temp_storage_false(
         self,
+        base_dir: Path,
+        shared_config: Config,
+        mock_stream: MagicMock,
         filename: str,
         subdir: str,
     ) -> None:
@@ -314,54 +364,36 @@ class TestTemporaryFileCleanup:
 
         **Validates: Requirements 3.2, 3.3**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        media_dir = base_dir / f"media_{unique_id}" / subdir
-
-        try:
-            # Create config with temp_storage=False
-            config = Config(
-                storage=StorageConfig(
-                    media_dir=str(media_dir),
-                    temp_storage=False,  # Key: temp_storage is disabled
-                )
-            )
+        media_dir = base_dir / "persist" / subdir
+
+        # Point the config at media_dir with temp_storage=False
+        config = shared_config
+        config.storage.media_dir = str(media_dir)
+        config.storage.temp_storage = False  # Key: temp_storage is disabled
+
+        mock_stream.return_value.iter_bytes.return_value = [FAKE_AUDIO_CONTENT]
+
+        file_path_during_context = None
+        with download_with_optional_cleanup(
+            f"https://example.com/{filename}",
+            config,
+            filename=filename,
+        ) as file_path:
+            file_path_during_context = file_path
+            assert file_path.exists(), f"File should exist during context at '{file_path}'"
+
+        # With temp_storage=False, file should still exist after context
+        assert file_path_during_context.exists(), (
+            f"With temp_storage=False, file '{file_path_during_context}' "
+            "should still exist after context exit"
+        )
 
-            test_content = b"persistent audio content"
-
-            with patch("podtext.services.downloader.httpx.stream") as mock_stream:
-                mock_response = MagicMock()
-                mock_response.iter_bytes.return_value = [test_content]
-                mock_response.raise_for_status = MagicMock()
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
-                mock_stream.return_value = mock_response
-
-                file_path_during_context = None
-                with download_with_optional_cleanup(
-                    f"https://example.com/{filename}",
-                    config,
-                    filename=filename,
-                ) as file_path:
-                    file_path_during_context = file_path
-                    assert file_path.exists(), f"File should exist during context at '{file_path}'"
-
-                # With temp_storage=False, file should still exist after context
-                assert file_path_during_context.exists(), (
-                    f"With temp_storage=False, file '{file_path_during_context}' "
-                    "should still exist after context exit"
-                )
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
-
-    @settings(max_examples=100)
     @given(
         filename=filename_strategy,
     )
     def test_cleanup_media_file_removes_existing_file(
         self,
+        base_dir: Path,
         filename: str,
     ) -> None:
         """Property 6: Temporary File Cleanup - cleanup_media_file function
@@ -372,29 +404,22 @@ class TestTemporaryFileCleanup:
 
         **Validates: Requirements 3.3**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        file_path = base_dir / f"test_{unique_id}" / filename
-
-        try:
-            # Create the file
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_bytes(b"content to be deleted")
+        # Every example deletes its file again, so base_dir can be used directly
+        file_path = base_dir / filename
 
-            assert file_path.exists(), "File should exist before cleanup"
+        # Create the file
+        file_path.write_bytes(FAKE_AUDIO_CONTENT)
 
-            # Call cleanup
-            result = cleanup_media_file(file_path)
+        assert file_path.exists(), "File should exist before cleanup"
 
-            # Property: After cleanup, file SHALL not exist
-            assert result is True, "cleanup_media_file should return True for existing file"
-            assert not file_path.exists(), (
-                f"After cleanup_media_file, file '{file_path}' should NOT exist"
-            )
-        finally:
-            import shutil
+        # Call cleanup
+        result = cleanup_media_file(file_path)
 
-            shutil.rmtree(base_dir, ignore_errors=True)
+        # Property: After cleanup, file SHALL not exist
+        assert result is True, "cleanup_media_file should return True for existing file"
+        assert not file_path.exists(), (
+            f"After cleanup_media_file, file '{file_path}' should NOT exist"
+        )
 
 
 # =============================================================================
@@ -402,6 +427,29 @@ class TestTemporaryFileCleanup:
 # =============================================================================
 
 
+@pytest.fixture(scope="class")
+def skip_audio_validation() -> Generator[None]:
+    """Patch out the audio file existence check so no file has to be written."""
+    with patch("podtext.services.transcriber._validate_audio_path"):
+        yield
+
+
+@pytest.fixture(scope="class")
+def model_repos(mlx_mock: MagicMock) -> Generator[list[str]]:
+    """Record the model repo of every mlx_whisper.transcribe() call in a plain list."""
+    recorded: list[str] = []
+    result = mlx_mock.transcribe.return_value
+
+    def record(audio: str, *, path_or_hf_repo: str) -> dict[str, Any]:
+        recorded.append(path_or_hf_repo)
+        return result
+
+    mlx_mock.transcribe.side_effect = record
+    yield recorded
+    mlx_mock.transcribe.side_effect = None
+
+
+@pytest.mark.usefixtures("skip_audio_validation")
 class TestConfigModelPropagation:
     """Property 7: Config Model Propagation
 
@@ -413,12 +461,10 @@ class TestConfigModelPropagation:
     **Validates: Requirements 4.2**
     """
 
-    @settings(max_examples=100)
-    @given(
-        model=whisper_model_strategy,
-    )
+    @pytest.mark.parametrize("model", WHISPER_MODELS)
     def test_transcribe_uses_specified_model(
         self,
+        model_repos: list[str],
         model: str,
     ) -> None:
         """Property 7: Config Model Propagation
@@ -430,44 +476,21 @@ class TestConfigModelPropagation:
 
         **Validates: Requirements 4.2**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        audio_file = base_dir / f"test_{unique_id}.mp3"
-
-        try:
-            # Create a fake audio file
-            audio_file.write_bytes(b"fake audio content")
-
-            with patch("podtext.services.transcriber.MLX_WHISPER_AVAILABLE", True):
-                with patch("podtext.services.transcriber.mlx_whisper") as mock_mlx:
-                    mock_mlx.transcribe.return_value = {
-                        "text": "Test transcription",
-                        "segments": [{"text": "Test transcription."}],
-                        "language": "en",
-                    }
-
-                    # Call transcribe with the specified model
-                    transcribe(audio_file, model=model)
-
-                    # Property: transcription function SHALL be called with model parameter M
-                    mock_mlx.transcribe.assert_called_once()
-                    call_args = mock_mlx.transcribe.call_args
-
-                    # Verify the model path contains the specified model
-                    path_or_hf_repo = call_args.kwargs.get("path_or_hf_repo", "")
-                    assert f"whisper-{model}" in path_or_hf_repo, (
-                        f"Transcription should use model '{model}', "
-                        f"but path_or_hf_repo was '{path_or_hf_repo}'"
-                    )
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
-
-    @settings(max_examples=100)
-    @given(
-        model=whisper_model_strategy,
-    )
+        model_repos.clear()
+
+        # Call transcribe with the specified model
+        transcribe(FAKE_AUDIO_PATH, model=model)
+
+        # Property: transcription function SHALL be called with model parameter M
+        assert len(model_repos) == 1
+
+        # Verify the model path contains the specified model
+        path_or_hf_repo = model_repos[0]
+        assert WHISPER_REPO_MARKERS[model] in path_or_hf_repo, (
+            f"Transcription should use model '{model}', but path_or_hf_repo was '{path_or_hf_repo}'"
+        )
+
+    @pytest.mark.parametrize("model", WHISPER_MODELS)
     def test_transcribe_with_config_propagates_model(
         self,
         model: str,
@@ -481,44 +504,26 @@ class TestConfigModelPropagation:
 
         **Validates: Requirements 4.2**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        audio_file = base_dir / f"test_{unique_id}.mp3"
-
-        try:
-            audio_file.write_bytes(b"fake audio content")
-
-            with patch("podtext.services.transcriber.transcribe") as mock_transcribe:
-                mock_transcribe.return_value = TranscriptionResult(
-                    text="Test",
-                    paragraphs=["Test."],
-                    language="en",
-                )
-
-                # Call transcribe_with_config with the specified model
-                transcribe_with_config(audio_file, model=model)
-
-                # Property: transcribe SHALL be called with model parameter M
-                mock_transcribe.assert_called_once()
-                call_args = mock_transcribe.call_args
-
-                # The model should be passed as the second positional argument
-                assert call_args[0][1] == model, (
-                    f"transcribe should be called with model '{model}', "
-                    f"but was called with '{call_args[0][1]}'"
-                )
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
-
-    @settings(max_examples=100)
-    @given(
-        model1=whisper_model_strategy,
-        model2=whisper_model_strategy,
-    )
+        with patch("podtext.services.transcriber.transcribe") as mock_transcribe:
+            mock_transcribe.return_value = FAKE_TRANSCRIPTION_RESULT
+
+            # Call transcribe_with_config with the specified model
+            transcribe_with_config(FAKE_AUDIO_PATH, model=model)
+
+            # Property: transcribe SHALL be called with model parameter M
+            mock_transcribe.assert_called_once()
+            call_args = mock_transcribe.call_args
+
+            # The model should be passed as the second positional argument
+            assert call_args[0][1] == model, (
+                f"transcribe should be called with model '{model}', "
+                f"but was called with '{call_args[0][1]}'"
+            )
+
+    @pytest.mark.parametrize(("model1", "model2"), WHISPER_MODEL_PAIRS)
     def test_different_models_produce_different_calls(
         self,
+        model_repos: list[str],
         model1: str,
         model2: str,
     ) -> None:
@@ -531,49 +536,22 @@ class TestConfigModelPropagation:
 
         **Validates: Requirements 4.2**
         """
-        # Only test when models are different
-        assume(model1 != model2)
-
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        audio_file = base_dir / f"test_{unique_id}.mp3"
-
-        try:
-            audio_file.write_bytes(b"fake audio content")
-
-            with patch("podtext.services.transcriber.MLX_WHISPER_AVAILABLE", True):
-                with patch("podtext.services.transcriber.mlx_whisper") as mock_mlx:
-                    mock_mlx.transcribe.return_value = {
-                        "text": "Test",
-                        "segments": [],
-                        "language": "en",
-                    }
-
-                    # Call with first model
-                    transcribe(audio_file, model=model1)
-                    call1_path = mock_mlx.transcribe.call_args.kwargs.get("path_or_hf_repo", "")
-
-                    mock_mlx.reset_mock()
-
-                    # Call with second model
-                    transcribe(audio_file, model=model2)
-                    call2_path = mock_mlx.transcribe.call_args.kwargs.get("path_or_hf_repo", "")
-
-                    # Property: Different models SHALL produce different path_or_hf_repo values
-                    assert call1_path != call2_path, (
-                        f"Different models '{model1}' and '{model2}' should produce "
-                        f"different paths, but both got '{call1_path}'"
-                    )
-                    assert f"whisper-{model1}" in call1_path, (
-                        f"First call should use model '{model1}'"
-                    )
-                    assert f"whisper-{model2}" in call2_path, (
-                        f"Second call should use model '{model2}'"
-                    )
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
+        model_repos.clear()
+
+        # Call with first model, then with second model
+        transcribe(FAKE_AUDIO_PATH, model=model1)
+        transcribe(FAKE_AUDIO_PATH, model=model2)
+        call1_path, call2_path = model_repos
+
+        # Property: Different models SHALL produce different path_or_hf_repo values
+        assert call1_path != call2_path, (
+            f"Different models '{model1}' and '{model2}' should produce "
+            f"different paths, but both got '{call1_path}'"
+        )
+        assert WHISPER_REPO_MARKERS[model1] in call1_path, f"First call should use model '{model1}'"
+        assert WHISPER_REPO_MARKERS[model2] in call2_path, (
+            f"Second call should use model '{model2}'"
+        )
 
 
 # =============================================================================
@@ -581,6 +559,26 @@ class TestConfigModelPropagation:
 # =============================================================================
 
 
+@pytest.fixture(scope="class")
+def warn_calls() -> Generator[list[str]]:
+    """Record non-English warnings for a whole class instead of patching per example."""
+    recorded: list[str] = []
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("podtext.services.transcriber._warn_non_english", recorded.append)
+        yield recorded
+
+
+@pytest.fixture(scope="class")
+def transcriber_mocks(mlx_mock: MagicMock) -> Generator[SimpleNamespace]:
+    """Patch language detection once for a whole class, on top of mlx_mock.
+
+    Examples only overwrite the ``language`` key of the transcription result
+    and reset the mocks instead of re-entering the patches.
+    """
+    with patch("podtext.services.transcriber._detect_language", wraps=_detect_language) as detect:
+        yield SimpleNamespace(mlx=mlx_mock, detect=detect)
+
+
 class TestLanguageCheckBypass:
     """Property 9: Language Check Bypass
 
@@ -592,12 +590,18 @@ class TestLanguageCheckBypass:
     **Validates: Requirements 5.3**
     """
 
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("skip_language_check", [True, False])
     @given(
         detected_language=language_code_strategy,
     )
-    def test_language_detection_bypassed_when_skip_flag_set(
+    @example(detected_language="en")
+    @example(detected_language="fr")
+    def test_language_check_respects_skip_flag(
         self,
+        fake_audio_file: Path,
+        transcriber_mocks: SimpleNamespace,
+        warn_calls: list[str],
+        skip_language_check: bool,
         detected_language: str,
     ) -> None:
         """Property 9: Language Check Bypass
@@ -605,156 +609,54 @@ class TestLanguageCheckBypass:
         Feature: podtext, Property 9: Language Check Bypass
 
         For any transcription operation with skip-language-check flag set,
-        the language detection function SHALL not be called.
+        the language detection function SHALL not be called and no language
+        warning SHALL be displayed, even for non-English content. Without the
+        flag, the detected language SHALL be reported and non-English content
+        SHALL produce a warning.
 
-        **Validates: Requirements 5.3**
+        **Validates: Requirements 5.1, 5.3**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        audio_file = base_dir / f"test_{unique_id}.mp3"
-
-        try:
-            audio_file.write_bytes(b"fake audio content")
-
-            with patch("podtext.services.transcriber.MLX_WHISPER_AVAILABLE", True):
-                with patch("podtext.services.transcriber.mlx_whisper") as mock_mlx:
-                    with patch("podtext.services.transcriber._detect_language") as mock_detect:
-                        with patch("podtext.services.transcriber._warn_non_english") as mock_warn:
-                            mock_mlx.transcribe.return_value = {
-                                "text": "Test transcription",
-                                "segments": [{"text": "Test."}],
-                                "language": detected_language,
-                            }
-
-                            # Call transcribe with skip_language_check=True
-                            result = transcribe(
-                                audio_file,
-                                skip_language_check=True,
-                            )
-
-                            # Property: language detection function SHALL not be called
-                            mock_detect.assert_not_called()
-
-                            # Also verify warning is not called
-                            mock_warn.assert_not_called()
-
-                            # Language should be set to "unknown" when skipped
-                            assert result.language == "unknown", (
-                                f"When skip_language_check=True, language should be 'unknown', "
-                                f"but got '{result.language}'"
-                            )
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
-
-    @settings(max_examples=100)
-    @given(
-        detected_language=language_code_strategy,
-    )
-    def test_language_detection_called_when_skip_flag_not_set(
-        self,
-        detected_language: str,
-    ) -> None:
-        """Property 9: Language Check Bypass - Inverse
+        transcriber_mocks.mlx.reset_mock()
+        transcriber_mocks.detect.reset_mock()
+        warn_calls.clear()
 
-        Feature: podtext, Property 9: Language Check Bypass
+        transcriber_mocks.mlx.transcribe.return_value["language"] = detected_language
 
-        For any transcription operation WITHOUT skip-language-check flag,
-        the language detection SHALL be performed.
+        result = transcribe(
+            fake_audio_file,
+            skip_language_check=skip_language_check,
+        )
 
-        **Validates: Requirements 5.1, 5.3**
-        """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        audio_file = base_dir / f"test_{unique_id}.mp3"
-
-        try:
-            audio_file.write_bytes(b"fake audio content")
-
-            with patch("podtext.services.transcriber.MLX_WHISPER_AVAILABLE", True):
-                with patch("podtext.services.transcriber.mlx_whisper") as mock_mlx:
-                    mock_mlx.transcribe.return_value = {
-                        "text": "Test transcription",
-                        "segments": [{"text": "Test."}],
-                        "language": detected_language,
-                    }
-
-                    # Call transcribe with skip_language_check=False (default)
-                    result = transcribe(
-                        audio_file,
-                        skip_language_check=False,
-                    )
-
-                    # Language detection should be performed
-                    # The result should contain the detected language
-                    assert result.language == detected_language, (
-                        f"When skip_language_check=False, "
-                        f"language should be '{detected_language}', "
-                        f"but got '{result.language}'"
-                    )
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
-
-    @settings(max_examples=100)
-    @given(
-        non_english_language=st.sampled_from(
-            ["es", "fr", "de", "ja", "zh", "ko", "pt", "it", "ru"]
-        ),
-    )
-    def test_no_warning_when_skip_flag_set_for_non_english(
-        self,
-        non_english_language: str,
-    ) -> None:
-        """Property 9: Language Check Bypass - No Warning
+        if skip_language_check:
+            # Property: language detection function SHALL not be called
+            transcriber_mocks.detect.assert_not_called()
 
-        Feature: podtext, Property 9: Language Check Bypass
+            # Property: No warning SHALL be displayed
+            assert not warn_calls, f"Unexpected language warning: {warn_calls}"
 
-        For any transcription operation with skip-language-check flag set,
-        no language warning SHALL be displayed even for non-English content.
+            # Language should be set to "unknown" when skipped
+            assert result.language == "unknown", (
+                f"When skip_language_check=True, language should be "
+                f"'unknown', but got '{result.language}'"
+            )
+        else:
+            # Language detection should be performed
+            transcriber_mocks.detect.assert_called_once()
+            assert result.language == detected_language, (
+                f"When skip_language_check=False, "
+                f"language should be '{detected_language}', "
+                f"but got '{result.language}'"
+            )
 
-        **Validates: Requirements 5.3**
-        """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        audio_file = base_dir / f"test_{unique_id}.mp3"
-
-        try:
-            audio_file.write_bytes(b"fake audio content")
-
-            with patch("podtext.services.transcriber.MLX_WHISPER_AVAILABLE", True):
-                with patch("podtext.services.transcriber.mlx_whisper") as mock_mlx:
-                    with patch("podtext.services.transcriber._warn_non_english") as mock_warn:
-                        mock_mlx.transcribe.return_value = {
-                            "text": "Contenido en otro idioma",
-                            "segments": [{"text": "Contenido."}],
-                            "language": non_english_language,
-                        }
-
-                        # Call transcribe with skip_language_check=True
-                        result = transcribe(
-                            audio_file,
-                            skip_language_check=True,
-                        )
-
-                        # Property: No warning SHALL be displayed
-                        mock_warn.assert_not_called()
-
-                        # Language should be "unknown" when skipped
-                        assert result.language == "unknown"
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
-
-    @settings(max_examples=100)
-    @given(
-        model=whisper_model_strategy,
-    )
+            # Only non-English content SHALL produce a warning
+            expected_warnings = [] if detected_language == "en" else [detected_language]
+            assert warn_calls == expected_warnings
+
+    @pytest.mark.parametrize("model", WHISPER_MODELS)
     def test_skip_language_check_works_with_any_model(
         self,
+        fake_audio_file: Path,
+        transcriber_mocks: SimpleNamespace,
         model: str,
     ) -> None:
         """Property 9: Language Check Bypass - Model Independence
@@ -766,42 +668,74 @@ class TestLanguageCheckBypass:
 
         **Validates: Requirements 4.2, 5.3**
         """
-        base_dir = Path(tempfile.mkdtemp())
-        unique_id = str(uuid.uuid4())[:8]
-        audio_file = base_dir / f"test_{unique_id}.mp3"
-
-        try:
-            audio_file.write_bytes(b"fake audio content")
-
-            with patch("podtext.services.transcriber.MLX_WHISPER_AVAILABLE", True):
-                with patch("podtext.services.transcriber.mlx_whisper") as mock_mlx:
-                    with patch("podtext.services.transcriber._detect_language") as mock_detect:
-                        mock_mlx.transcribe.return_value = {
-                            "text": "Test",
-                            "segments": [],
-                            "language": "fr",
-                        }
-
-                        # Call transcribe with skip_language_check=True and specified model
-                        result = transcribe(
-                            audio_file,
-                            model=model,
-                            skip_language_check=True,
-                        )
-
-                        # Property: language detection SHALL not be called regardless of model
-                        mock_detect.assert_not_called()
-
-                        # Verify the correct model was still used
-                        call_args = mock_mlx.transcribe.call_args
-                        path_or_hf_repo = call_args.kwargs.get("path_or_hf_repo", "")
-                        assert f"whisper-{model}" in path_or_hf_repo, (
-                            f"Model '{model}' should still be used with skip_language_check"
-                        )
-
-                        # Language should be "unknown"
-                        assert result.language == "unknown"
-        finally:
-            import shutil
-
-            shutil.rmtree(base_dir, ignore_errors=True)
+        transcriber_mocks.mlx.reset_mock()
+        transcriber_mocks.detect.reset_mock()
+
+        transcriber_mocks.mlx.transcribe.return_value["language"] = "fr"
+
+        # Call transcribe with skip_language_check=True and specified model
+        result = transcribe(
+            fake_audio_file,
+            model=model,
+            skip_language_check=True,
+        )
+
+        # Property: language detection SHALL not be called regardless of model
+        transcriber_mocks.detect.assert_not_called()
+
+        # Verify the correct model was still used
+        call_args = transcriber_mocks.mlx.transcribe.call_args
+        path_or_hf_repo = call_args.kwargs.get("path_or_hf_repo", "")
+        assert WHISPER_REPO_MARKERS[model] in path_or_hf_repo, (
+            f"Model '{model}' should still be used with skip_language_check"
+        )
+
+        # Language should be "unknown"
+        assert result.language == "unknown"
+
+
+# =============================================================================
+# Paragraph Extraction
+# =============================================================================
+
+# Strategy for Whisper segments with timing, as produced by mlx_whisper
+segment_strategy = st.builds(
+    lambda text, start, duration: {"text": text, "start": start, "end": start + duration},
+    st.text(min_size=1, max_size=50),
+    st.floats(min_value=0, max_value=3600),
+    st.floats(min_value=0.1, max_value=5.0),
+)
+
+
+class TestParagraphExtraction:
+    """Paragraph Extraction
+
+    Feature: podtext, Paragraph Extraction
+
+    For any list of Whisper segments, the extracted paragraphs SHALL contain
+    exactly the segment text, in order, with segments joined by single spaces.
+
+    **Validates: Requirements 4.3**
+    """
+
+    @given(
+        segments=st.lists(segment_strategy, max_size=200),
+    )
+    def test_extract_paragraphs_property(self, segments: list[dict[str, Any]]) -> None:
+        """Paragraph Extraction - Text Preservation
+
+        Feature: podtext, Paragraph Extraction
+
+        For any list of segments, paragraphs SHALL only add the joining spaces
+        between segments: no text is lost, reordered, or duplicated, and no
+        paragraph is empty.
+
+        **Validates: Requirements 4.3**
+        """
+        paragraphs = _extract_paragraphs(segments)
+
+        texts = [s["text"].strip() for s in segments if s["text"].strip()]
+
+        # Property: paragraphs reproduce the segment text in order
+        assert " ".join(paragraphs) == " ".join(texts)
+        assert all(paragraphs)
@@ -5,9 +5,9 @@ Tests markdown generation functionality including frontmatter and content format
 Requirements: 4.4, 4.5, 7.2, 7.3, 7.4, 7.5, 7.6
 """
 
-import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
@@ -22,9 +22,10 @@ from podtext.core.output import (
 from podtext.services.claude import AnalysisResult
 from podtext.services.rss import EpisodeInfo
 from podtext.services.transcriber import TranscriptionResult
+from yaml_helpers import YAML_LOADER
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_episode() -> EpisodeInfo:
     """Create a sample episode for testing."""
     return EpisodeInfo(
@@ -35,7 +36,7 @@ def sample_episode() -> EpisodeInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_transcription() -> TranscriptionResult:
     """Create a sample transcription for testing."""
     return TranscriptionResult(
@@ -49,7 +50,7 @@ def sample_transcription() -> TranscriptionResult:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_analysis() -> AnalysisResult:
     """Create a sample analysis result for testing."""
     return AnalysisResult(
@@ -60,7 +61,35 @@ def sample_analysis() -> AnalysisResult:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def output_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one output directory shared by the file-writing tests."""
+    return tmp_path_factory.mktemp("output")
+
+
+@pytest.fixture(scope="class")
+def sample_markdown_file(
+    output_dir: Path,
+    sample_episode: EpisodeInfo,
+    sample_transcription: TranscriptionResult,
+    sample_analysis: AnalysisResult,
+) -> Path:
+    """Write the sample markdown once for tests that only inspect the result."""
+    output_path = output_dir / "sample.md"
+    generate_markdown(sample_episode, sample_transcription, sample_analysis, output_path)
+    return output_path
+
+
+@pytest.fixture(scope="class")
+def parsed_frontmatter(
+    sample_episode: EpisodeInfo, sample_analysis: AnalysisResult
+) -> dict[str, Any]:
+    """Format and parse the sample frontmatter once for tests that only read it."""
+    result = _format_frontmatter(sample_episode, sample_analysis)
+    return yaml.load(extract_frontmatter(result), Loader=YAML_LOADER)
+
+
+@pytest.fixture(scope="module")
 def analysis_with_ads() -> AnalysisResult:
     """Create an analysis result with advertisement markers."""
     return AnalysisResult(
@@ -71,6 +100,17 @@ def analysis_with_ads() -> AnalysisResult:
     )
 
 
+def extract_frontmatter(markdown: str) -> str:
+    """Return the YAML between the opening and closing '---' delimiters.
+
+    Only the header is sliced out, so the body is never split or copied.
+    """
+    assert markdown.startswith("---\n"), "Markdown should start with '---'"
+    end = markdown.find("\n---\n", 3)
+    assert end != -1, "Markdown should have a closing '---' delimiter"
+    return markdown[4:end]
+
+
 class TestFormatFrontmatter:
     """Tests for _format_frontmatter helper function."""
 
@@ -80,91 +120,62 @@ class TestFormatFrontmatter:
         assert result.startswith("---\n")
         assert result.endswith("---\n")
 
-    def test_contains_title(self, sample_episode, sample_analysis):
+    def test_contains_title(self, parsed_frontmatter):
         """Validates: Requirement 4.5 - Title in frontmatter."""
-        result = _format_frontmatter(sample_episode, sample_analysis)
-        # Parse YAML to verify
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
-        assert data["title"] == "Test Episode Title"
+        assert parsed_frontmatter["title"] == "Test Episode Title"
 
-    def test_contains_pub_date(self, sample_episode, sample_analysis):
+    def test_contains_pub_date(self, parsed_frontmatter):
         """Validates: Requirement 4.5 - Publication date in frontmatter."""
-        result = _format_frontmatter(sample_episode, sample_analysis)
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
-        assert data["pub_date"] == "2024-01-15"
+        assert parsed_frontmatter["pub_date"] == "2024-01-15"
 
-    def test_summary_not_in_frontmatter(self, sample_episode, sample_analysis):
+    def test_summary_not_in_frontmatter(self, parsed_frontmatter):
         """Summary is no longer included in frontmatter (moved to main content)."""
-        result = _format_frontmatter(sample_episode, sample_analysis)
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
-        assert "summary" not in data
+        assert "summary" not in parsed_frontmatter
 
-    def test_contains_topics(self, sample_episode, sample_analysis):
+    def test_contains_topics(self, parsed_frontmatter):
         """Validates: Requirement 7.3 - Topics in frontmatter."""
-        result = _format_frontmatter(sample_episode, sample_analysis)
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
-        assert "topics" in data
-        assert len(data["topics"]) == 2
-        assert "Software testing fundamentals" in data["topics"]
+        assert "topics" in parsed_frontmatter
+        assert len(parsed_frontmatter["topics"]) == 2
+        assert "Software testing fundamentals" in parsed_frontmatter["topics"]
 
-    def test_contains_keywords(self, sample_episode, sample_analysis):
+    def test_contains_keywords(self, parsed_frontmatter):
         """Validates: Requirement 7.4 - Keywords in frontmatter."""
-        result = _format_frontmatter(sample_episode, sample_analysis)
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
-        assert "keywords" in data
-        assert "testing" in data["keywords"]
-        assert "software" in data["keywords"]
+        assert "keywords" in parsed_frontmatter
+        assert "testing" in parsed_frontmatter["keywords"]
+        assert "software" in parsed_frontmatter["keywords"]
 
     def test_includes_podcast_name(self, sample_episode, sample_analysis):
         """Podcast name is included when provided."""
         result = _format_frontmatter(sample_episode, sample_analysis, "My Podcast")
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(extract_frontmatter(result), Loader=YAML_LOADER)
         assert data["podcast"] == "My Podcast"
 
     def test_omits_podcast_name_when_empty(self, sample_episode, sample_analysis):
         """Podcast name is omitted when not provided."""
         result = _format_frontmatter(sample_episode, sample_analysis, "")
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(extract_frontmatter(result), Loader=YAML_LOADER)
         assert "podcast" not in data
 
-    def test_omits_empty_summary(self, sample_episode):
-        """Empty summary is omitted from frontmatter."""
-        analysis = AnalysisResult(summary="", topics=[], keywords=[], ad_markers=[])
-        result = _format_frontmatter(sample_episode, analysis)
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
-        assert "summary" not in data
-
-    def test_omits_empty_topics(self, sample_episode):
-        """Empty topics list is omitted from frontmatter."""
-        analysis = AnalysisResult(summary="Test", topics=[], keywords=["kw"], ad_markers=[])
-        result = _format_frontmatter(sample_episode, analysis)
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
-        assert "topics" not in data
-
-    def test_omits_empty_keywords(self, sample_episode):
-        """Empty keywords list is omitted from frontmatter."""
-        analysis = AnalysisResult(summary="Test", topics=["topic"], keywords=[], ad_markers=[])
+    @pytest.mark.parametrize(
+        ("field", "analysis"),
+        [
+            ("summary", AnalysisResult(summary="", topics=[], keywords=[], ad_markers=[])),
+            ("topics", AnalysisResult(summary="Test", topics=[], keywords=["kw"], ad_markers=[])),
+            (
+                "keywords",
+                AnalysisResult(summary="Test", topics=["topic"], keywords=[], ad_markers=[]),
+            ),
+        ],
+    )
+    def test_omits_empty_field(self, sample_episode, field, analysis):
+        """Empty summary, topics and keywords are omitted from frontmatter."""
         result = _format_frontmatter(sample_episode, analysis)
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
-        assert "keywords" not in data
+        data = yaml.load(extract_frontmatter(result), Loader=YAML_LOADER)
+        assert field not in data
 
-    def test_valid_yaml_output(self, sample_episode, sample_analysis):
+    def test_valid_yaml_output(self, parsed_frontmatter):
         """Output is valid YAML that can be parsed."""
-        result = _format_frontmatter(sample_episode, sample_analysis)
-        yaml_content = result.strip("---\n")
-        # Should not raise
-        data = yaml.safe_load(yaml_content)
-        assert isinstance(data, dict)
+        assert isinstance(parsed_frontmatter, dict)
 
     def test_unicode_content(self, sample_analysis):
         """Unicode content is handled correctly."""
@@ -175,8 +186,7 @@ class TestFormatFrontmatter:
             media_url="https://example.com/ep.mp3",
         )
         result = _format_frontmatter(episode, sample_analysis)
-        yaml_content = result.strip("---\n")
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(extract_frontmatter(result), Loader=YAML_LOADER)
         assert "café" in data["title"]
         assert "naïve" in data["title"]
 
@@ -289,6 +299,10 @@ class TestAddParagraphBreaks:
         # Should not have excessive newlines
         assert "\n\n\n" not in result
 
+    def test_only_newline_separates_lines(self):
+        """Other line-boundary characters such as form feed stay in the text."""
+        assert _add_paragraph_breaks("a\x0cb\nc") == "a\x0cb\n\nc"
+
 
 class TestGenerateMarkdownString:
     """Tests for generate_markdown_string function."""
@@ -320,21 +334,7 @@ class TestGenerateMarkdownString:
     ):
         """Validates: Requirement 7.6 - All analysis results included."""
         result = generate_markdown_string(sample_episode, sample_transcription, sample_analysis)
-        # Extract and parse frontmatter
-        lines = result.split("\n")
-        yaml_lines = []
-        in_frontmatter = False
-        for line in lines:
-            if line == "---":
-                if in_frontmatter:
-                    break
-                in_frontmatter = True
-                continue
-            if in_frontmatter:
-                yaml_lines.append(line)
-
-        yaml_content = "\n".join(yaml_lines)
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(extract_frontmatter(result), Loader=YAML_LOADER)
 
         # Topics and keywords should be in frontmatter
         assert "topics" in data
@@ -345,6 +345,13 @@ class TestGenerateMarkdownString:
         assert "## Summary" in result
         assert "A test episode about software testing practices." in result
 
+    def test_with_advertisement_markers(
+        self, sample_episode, sample_transcription, analysis_with_ads
+    ):
+        """Validates: Requirement 7.5 - Sponsor content marked."""
+        result = generate_markdown_string(sample_episode, sample_transcription, analysis_with_ads)
+        assert "ADVERTISEMENT WAS REMOVED" in result
+
     def test_with_podcast_name(self, sample_episode, sample_transcription, sample_analysis):
         """Podcast name is included when provided."""
         result = generate_markdown_string(
@@ -357,50 +364,44 @@ class TestGenerateMarkdownString:
 class TestGenerateMarkdown:
     """Tests for generate_markdown function."""
 
-    def test_creates_file(self, sample_episode, sample_transcription, sample_analysis):
+    def test_creates_file(self, sample_markdown_file):
         """Validates: Requirement 4.4 - Generates markdown file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.md"
-            generate_markdown(sample_episode, sample_transcription, sample_analysis, output_path)
-            assert output_path.exists()
+        assert sample_markdown_file.exists()
 
     def test_file_content_matches_string(
-        self, sample_episode, sample_transcription, sample_analysis
+        self, sample_markdown_file, sample_episode, sample_transcription, sample_analysis
     ):
         """File content matches string generation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.md"
-            generate_markdown(sample_episode, sample_transcription, sample_analysis, output_path)
-
-            file_content = output_path.read_text(encoding="utf-8")
-            string_content = generate_markdown_string(
-                sample_episode, sample_transcription, sample_analysis
-            )
+        file_content = sample_markdown_file.read_text(encoding="utf-8")
+        string_content = generate_markdown_string(
+            sample_episode, sample_transcription, sample_analysis
+        )
 
-            assert file_content == string_content
+        assert file_content == string_content
 
     def test_creates_parent_directories(
-        self, sample_episode, sample_transcription, sample_analysis
+        self, output_dir, sample_episode, sample_transcription, sample_analysis
     ):
         """Parent directories are created if they don't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "nested" / "dirs" / "output.md"
-            generate_markdown(sample_episode, sample_transcription, sample_analysis, output_path)
-            assert output_path.exists()
+        output_path = output_dir / "nested" / "dirs" / "output.md"
+        generate_markdown(sample_episode, sample_transcription, sample_analysis, output_path)
+        assert output_path.exists()
 
-    def test_overwrites_existing_file(self, sample_episode, sample_transcription, sample_analysis):
+    def test_overwrites_existing_file(
+        self, output_dir, sample_episode, sample_transcription, sample_analysis
+    ):
         """Existing file is overwritten."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.md"
-            output_path.write_text("old content")
+        output_path = output_dir / "overwrites.md"
+        output_path.write_text("old content")
 
-            generate_markdown(sample_episode, sample_transcription, sample_analysis, output_path)
+        generate_markdown(sample_episode, sample_transcription, sample_analysis, output_path)
 
-            content = output_path.read_text()
-            assert "old content" not in content
-            assert "title:" in content
+        # ASCII-only checks, so compare the raw bytes without decoding
+        content = output_path.read_bytes()
+        assert b"old content" not in content
+        assert b"title:" in content
 
-    def test_utf8_encoding(self, sample_transcription, sample_analysis):
+    def test_utf8_encoding(self, output_dir, sample_transcription, sample_analysis):
         """File is written with UTF-8 encoding."""
         episode = EpisodeInfo(
             index=1,
@@ -409,23 +410,11 @@ class TestGenerateMarkdown:
             media_url="https://example.com/ep.mp3",
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.md"
-            generate_markdown(episode, sample_transcription, sample_analysis, output_path)
+        output_path = output_dir / "utf8.md"
+        generate_markdown(episode, sample_transcription, sample_analysis, output_path)
 
-            content = output_path.read_text(encoding="utf-8")
-            assert "日本語タイトル" in content
-
-    def test_with_advertisement_markers(
-        self, sample_episode, sample_transcription, analysis_with_ads
-    ):
-        """Validates: Requirement 7.5 - Sponsor content marked."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.md"
-            generate_markdown(sample_episode, sample_transcription, analysis_with_ads, output_path)
-
-            content = output_path.read_text()
-            assert "ADVERTISEMENT WAS REMOVED" in content
+        content = output_path.read_text(encoding="utf-8")
+        assert "日本語タイトル" in content
 
 
 class TestMarkdownOutputCompleteness:
@@ -463,13 +452,8 @@ class TestMarkdownOutputCompleteness:
         """Frontmatter is valid, parseable YAML."""
         result = generate_markdown_string(sample_episode, sample_transcription, sample_analysis)
 
-        # Extract frontmatter
-        parts = result.split("---")
-        assert len(parts) >= 3
-        yaml_content = parts[1].strip()
-
         # Should parse without error
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(extract_frontmatter(result), Loader=YAML_LOADER)
         assert isinstance(data, dict)
         assert "title" in data
         assert "pub_date" in data
@@ -8,23 +8,36 @@ Validates: Requirements 4.4, 4.5, 6.2, 6.3, 7.6
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
+import re
 from datetime import datetime
 
+import pytest
 import yaml
-from hypothesis import assume, given, settings
+from hypothesis import assume, given
 from hypothesis import strategies as st
 
-from podtext.core.output import generate_markdown_string
-from podtext.core.processor import ADVERTISEMENT_MARKER, remove_advertisements
+from podtext.core.output import _format_frontmatter, generate_markdown_string
+from podtext.core.processor import (
+    ADVERTISEMENT_MARKER,
+    ADVERTISEMENT_MARKER_TEXT,
+    remove_advertisements,
+)
 from podtext.services.claude import AnalysisResult
 from podtext.services.rss import EpisodeInfo
 from podtext.services.transcriber import TranscriptionResult
+from yaml_helpers import YAML_LOADER
+
+# Frontmatter block at the start of generated markdown; group 1 is the YAML
+FRONTMATTER_PATTERN = re.compile(r"^---\n(.*?)\n---\n", re.DOTALL)
 
 # =============================================================================
 # Strategies for generating test data
 # =============================================================================
 
-# Strategy for non-empty text strings (titles, summaries, etc.)
+# Strategy for non-empty Unicode text; only the title round-trip test uses it,
+# everything else draws ASCII text, which is much cheaper to generate
 non_empty_text_strategy = st.text(
     alphabet=st.characters(
         whitelist_categories=("L", "N", "P", "S", "Zs"),
@@ -34,11 +47,12 @@ non_empty_text_strategy = st.text(
     max_size=100,
 ).filter(lambda s: s.strip())
 
-# Strategy for simple text (alphanumeric with spaces)
+# Strategy for simple text (alphanumeric with spaces); the leading letter
+# means it is never blank, so no strip filter is needed
 simple_text_strategy = st.from_regex(
     r"[A-Za-z][A-Za-z0-9 ]{0,50}",
     fullmatch=True,
-).filter(lambda s: s.strip())
+)
 
 # Strategy for keywords (simple words)
 keyword_strategy = st.from_regex(
@@ -67,12 +81,30 @@ datetime_strategy = st.datetimes(
 # Strategy for language codes
 language_strategy = st.sampled_from(["en", "es", "fr", "de", "ja", "zh"])
 
+# Strategy for episode indices
+episode_index_strategy = st.integers(min_value=1, max_value=1000)
+
+# Strategy for advertisement content embedded in generated text; built once
+# here rather than on every draw inside text_with_ad_blocks_strategy. The angle
+# brackets never occur in simple_text_strategy output, so an ad token found in
+# processed text can only come from an ad block.
+ad_content_strategy = st.from_regex(r"<AD[0-9]{1,3}>", fullmatch=True)
+
+# Any ad token drawn from ad_content_strategy
+AD_TOKEN_PATTERN = re.compile(r"<AD[0-9]{1,3}>")
+
+# List strategies drawn by the composites below, also built once
+paragraphs_strategy = st.lists(simple_text_strategy, min_size=1, max_size=5)
+topics_strategy = st.lists(topic_strategy, min_size=1, max_size=5)
+keywords_strategy = st.lists(keyword_strategy, min_size=1, max_size=10)
+text_parts_strategy = st.lists(simple_text_strategy, min_size=2, max_size=5)
+
 
 @st.composite
 def episode_info_strategy(draw: st.DrawFn) -> EpisodeInfo:
     """Generate a valid EpisodeInfo object."""
     return EpisodeInfo(
-        index=draw(st.integers(min_value=1, max_value=1000)),
+        index=draw(episode_index_strategy),
         title=draw(simple_text_strategy),
         pub_date=draw(datetime_strategy),
         media_url=draw(url_strategy),
@@ -83,8 +115,7 @@ def episode_info_strategy(draw: st.DrawFn) -> EpisodeInfo:
 def transcription_result_strategy(draw: st.DrawFn) -> TranscriptionResult:
     """Generate a valid TranscriptionResult object."""
     # Generate paragraphs
-    num_paragraphs = draw(st.integers(min_value=1, max_value=5))
-    paragraphs = [draw(simple_text_strategy) for _ in range(num_paragraphs)]
+    paragraphs = draw(paragraphs_strategy)
 
     # Full text is paragraphs joined
     text = " ".join(paragraphs)
@@ -103,12 +134,10 @@ def analysis_result_strategy(draw: st.DrawFn) -> AnalysisResult:
     summary = draw(simple_text_strategy)
 
     # Generate non-empty topics list
-    num_topics = draw(st.integers(min_value=1, max_value=5))
-    topics = [draw(topic_strategy) for _ in range(num_topics)]
+    topics = draw(topics_strategy)
 
     # Generate non-empty keywords list
-    num_keywords = draw(st.integers(min_value=1, max_value=10))
-    keywords = [draw(keyword_strategy) for _ in range(num_keywords)]
+    keywords = draw(keywords_strategy)
 
     return AnalysisResult(
         summary=summary,
@@ -119,40 +148,66 @@ def analysis_result_strategy(draw: st.DrawFn) -> AnalysisResult:
 
 
 @st.composite
-def text_with_ad_blocks_strategy(draw: st.DrawFn) -> tuple[str, list[tuple[int, int]]]:
+def text_with_ad_blocks_strategy(draw: st.DrawFn) -> tuple[str, list[tuple[int, int]], list[str]]:
     """Generate text with valid advertisement block positions.
 
-    Returns a tuple of (text, ad_positions) where ad_positions are valid
-    non-overlapping ranges within the text.
+    Returns a tuple of (text, ad_positions, ad_contents) where ad_positions are
+    valid non-overlapping ranges within the text, in ascending order, and
+    ad_contents holds the text of each range.
     """
     # Generate base text parts
-    num_parts = draw(st.integers(min_value=2, max_value=5))
-    parts = [draw(simple_text_strategy) for _ in range(num_parts)]
+    parts = draw(text_parts_strategy)
 
-    # Generate ad content
-    num_ads = draw(st.integers(min_value=1, max_value=min(3, num_parts - 1)))
-    ad_contents = [draw(st.from_regex(r"AD[0-9]{1,3}", fullmatch=True)) for _ in range(num_ads)]
+    # Generate ad content; at most one ad between each pair of parts
+    ad_contents = draw(st.lists(ad_content_strategy, min_size=1, max_size=min(3, len(parts) - 1)))
 
-    # Interleave parts and ads
-    text_parts: list[str] = []
-    ad_positions: list[tuple[int, int]] = []
-    current_pos = 0
+    # Interleave parts and ads: ad i follows part i, so it is segment 2i + 1
+    segments = list(itertools.chain.from_iterable(zip(parts, ad_contents)))
+    segments.extend(parts[len(ad_contents) :])
 
-    for i, part in enumerate(parts):
-        text_parts.append(part)
-        current_pos += len(part)
+    # Segment start offsets; ad i spans offsets[2i + 1] to offsets[2i + 2]
+    offsets = list(itertools.accumulate(map(len, segments), initial=0))
+    ad_positions = [(offsets[2 * i + 1], offsets[2 * i + 2]) for i in range(len(ad_contents))]
 
-        # Add ad after this part (but not after the last part)
-        if i < len(ad_contents):
-            ad_start = current_pos
-            ad_content = ad_contents[i]
-            text_parts.append(ad_content)
-            current_pos += len(ad_content)
-            ad_end = current_pos
-            ad_positions.append((ad_start, ad_end))
+    return "".join(segments), ad_positions, ad_contents
 
-    full_text = "".join(text_parts)
-    return full_text, ad_positions
+
+# =============================================================================
+# Fixed test data for parametrized tests
+# =============================================================================
+
+SAMPLE_EPISODE = EpisodeInfo(
+    index=1,
+    title="Sample Episode",
+    pub_date=datetime(2024, 1, 15),
+    media_url="https://example.com/episode.mp3",
+)
+
+SAMPLE_TRANSCRIPTION = TranscriptionResult(
+    text="First paragraph. Second paragraph.",
+    paragraphs=["First paragraph.", "Second paragraph."],
+    language="en",
+)
+
+SAMPLE_ANALYSIS = AnalysisResult(
+    summary="A sample summary",
+    topics=["Sample topic sentence."],
+    keywords=["sample", "test"],
+    ad_markers=[],
+)
+
+# Podcast names covering the cases a YAML round trip can get wrong
+PODCAST_NAMES = [
+    "A",
+    "Podcast 123",
+    "Café Crème Radio",
+    "日本語ポッドキャスト",
+    "Tech: News & Views!",
+    '"Quoted" Show',
+    "yes",
+    "2024",
+    "Long Name " * 12,
+]
 
 
 # =============================================================================
@@ -171,7 +226,6 @@ class TestMarkdownOutputCompleteness:
     **Validates: Requirements 4.4, 4.5, 7.6**
     """
 
-    @settings(max_examples=100)
     @given(
         episode=episode_info_strategy(),
         transcription=transcription_result_strategy(),
@@ -188,8 +242,8 @@ class TestMarkdownOutputCompleteness:
         Feature: podtext, Property 8: Markdown Output Completeness
 
         For any EpisodeInfo and AnalysisResult, the generated markdown SHALL contain
-        valid YAML frontmatter with title, pub_date, topics, and keywords fields.
-        Summary is now in main content, not frontmatter.
+        valid, parseable YAML frontmatter with title, pub_date, topics, and keywords
+        fields. Summary is now in main content, not frontmatter.
 
         **Validates: Requirements 4.4, 4.5, 7.6**
         """
@@ -202,17 +256,18 @@ class TestMarkdownOutputCompleteness:
         )
 
         # Extract frontmatter properly - find the closing --- on its own line
-        import re
-        match = re.match(r'^---\n(.*?)\n---\n', markdown, re.DOTALL)
+        match = FRONTMATTER_PATTERN.match(markdown)
         assert match is not None, "Markdown should have opening and closing '---' delimiters"
 
         yaml_content = match.group(1).strip()
 
         # Property: Frontmatter SHALL be valid YAML
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml.load(yaml_content, Loader=YAML_LOADER)
         except yaml.YAMLError as e:
-            raise AssertionError(f"Frontmatter is not valid YAML: {e}")
+            raise AssertionError(
+                f"Frontmatter is not valid YAML: {e}\nYAML content:\n{yaml_content}"
+            )
 
         assert isinstance(data, dict), "Frontmatter should parse to a dictionary"
 
@@ -240,9 +295,10 @@ class TestMarkdownOutputCompleteness:
         )
         
         # Property: Summary should be in main content when present
+        # (the summary is written stripped, and generated text may end in a space)
         if analysis.summary:
             assert "## Summary" in markdown, "Summary section should be in main content"
-            assert analysis.summary in markdown, "Summary text should be in main content"
+            assert analysis.summary.strip() in markdown, "Summary text should be in main content"
 
         # Property: Frontmatter SHALL contain topics field (when analysis has topics)
         assert "topics" in data, (
@@ -258,65 +314,9 @@ class TestMarkdownOutputCompleteness:
         assert isinstance(data["keywords"], list), "Keywords should be a list"
         assert data["keywords"] == analysis.keywords, "Keywords should match analysis keywords"
 
-    @settings(max_examples=100)
-    @given(
-        episode=episode_info_strategy(),
-        transcription=transcription_result_strategy(),
-        analysis=analysis_result_strategy(),
-    )
-    def test_markdown_frontmatter_is_parseable_yaml(
-        self,
-        episode: EpisodeInfo,
-        transcription: TranscriptionResult,
-        analysis: AnalysisResult,
-    ) -> None:
-        """Property 8: Markdown Output Completeness - YAML Validity
-
-        Feature: podtext, Property 8: Markdown Output Completeness
-
-        For any generated markdown, the frontmatter SHALL be valid, parseable YAML.
-
-        **Validates: Requirements 4.4, 4.5**
-        """
-        markdown = generate_markdown_string(episode, transcription, analysis)
-
-        # Extract frontmatter between --- delimiters
-        lines = markdown.split("\n")
-        yaml_lines: list[str] = []
-        in_frontmatter = False
-
-        for line in lines:
-            if line == "---":
-                if in_frontmatter:
-                    break
-                in_frontmatter = True
-                continue
-            if in_frontmatter:
-                yaml_lines.append(line)
-
-        yaml_content = "\n".join(yaml_lines)
-
-        # Property: YAML SHALL be parseable without errors
-        try:
-            data = yaml.safe_load(yaml_content)
-            assert isinstance(data, dict), "Parsed YAML should be a dictionary"
-        except yaml.YAMLError as e:
-            raise AssertionError(
-                f"Frontmatter YAML is not parseable: {e}\nYAML content:\n{yaml_content}"
-            )
-
-    @settings(max_examples=100)
-    @given(
-        episode=episode_info_strategy(),
-        transcription=transcription_result_strategy(),
-        analysis=analysis_result_strategy(),
-        podcast_name=simple_text_strategy,
-    )
+    @pytest.mark.parametrize("podcast_name", PODCAST_NAMES)
     def test_markdown_includes_optional_podcast_name(
         self,
-        episode: EpisodeInfo,
-        transcription: TranscriptionResult,
-        analysis: AnalysisResult,
         podcast_name: str,
     ) -> None:
         """Property 8: Markdown Output Completeness - Optional Fields
@@ -328,13 +328,14 @@ class TestMarkdownOutputCompleteness:
         **Validates: Requirements 4.5**
         """
         markdown = generate_markdown_string(
-            episode, transcription, analysis, podcast_name=podcast_name
+            SAMPLE_EPISODE, SAMPLE_TRANSCRIPTION, SAMPLE_ANALYSIS, podcast_name=podcast_name
         )
 
         # Extract and parse frontmatter
-        parts = markdown.split("---")
-        yaml_content = parts[1].strip()
-        data = yaml.safe_load(yaml_content)
+        match = FRONTMATTER_PATTERN.match(markdown)
+        assert match is not None, "Markdown should have opening and closing '---' delimiters"
+        yaml_content = match.group(1).strip()
+        data = yaml.load(yaml_content, Loader=YAML_LOADER)
 
         # Property: Podcast name SHALL be included when provided
         assert "podcast" in data, (
@@ -344,6 +345,25 @@ class TestMarkdownOutputCompleteness:
             f"Podcast name should match. Expected '{podcast_name}', got '{data['podcast']}'"
         )
 
+    @given(title=non_empty_text_strategy)
+    def test_frontmatter_title_round_trips_unicode(self, title: str) -> None:
+        """Property 8: Markdown Output Completeness - Unicode Titles
+
+        Feature: podtext, Property 8: Markdown Output Completeness
+
+        For any non-empty title drawn from letters, numbers, punctuation, symbols
+        and spaces in any script, the frontmatter title SHALL parse back to the
+        same string.
+
+        **Validates: Requirements 4.5**
+        """
+        episode = dataclasses.replace(SAMPLE_EPISODE, title=title)
+
+        frontmatter = _format_frontmatter(episode, SAMPLE_ANALYSIS)
+        data = next(yaml.load_all(frontmatter, Loader=YAML_LOADER))
+
+        assert data["title"] == title, f"Expected title {title!r}, got {data['title']!r}"
+
 
 # =============================================================================
 # Property 10: Advertisement Removal with Markers
@@ -362,13 +382,12 @@ class TestAdvertisementRemovalWithMarkers:
     **Validates: Requirements 6.2, 6.3**
     """
 
-    @settings(max_examples=100)
     @given(
         text_and_ads=text_with_ad_blocks_strategy(),
     )
     def test_advertisement_content_removed_from_output(
         self,
-        text_and_ads: tuple[str, list[tuple[int, int]]],
+        text_and_ads: tuple[str, list[tuple[int, int]], list[str]],
     ) -> None:
         """Property 10: Advertisement Removal with Markers
 
@@ -379,32 +398,30 @@ class TestAdvertisementRemovalWithMarkers:
 
         **Validates: Requirements 6.2**
         """
-        text, ad_positions = text_and_ads
+        text, ad_positions, ad_contents = text_and_ads
 
         # Skip if no ads
         assume(len(ad_positions) > 0)
 
-        # Extract the actual ad content before removal
-        ad_contents = [text[start:end] for start, end in ad_positions]
-
         # Remove advertisements
         result = remove_advertisements(text, ad_positions)
 
-        # Property: Output text SHALL not contain the advertisement content
-        for ad_content in ad_contents:
-            assert ad_content not in result, (
-                f"Advertisement content '{ad_content}' should NOT be in output.\n"
-                f"Original text: '{text}'\n"
-                f"Result: '{result}'"
-            )
+        # Property: Output text SHALL not contain the advertisement content;
+        # one scan for any ad token covers every ad block
+        leftover = AD_TOKEN_PATTERN.search(result)
+        assert leftover is None, (
+            f"Advertisement content '{leftover.group()}' should NOT be in output.\n"
+            f"Ads: {ad_contents}\n"
+            f"Original text: '{text}'\n"
+            f"Result: '{result}'"
+        )
 
-    @settings(max_examples=100)
     @given(
         text_and_ads=text_with_ad_blocks_strategy(),
     )
     def test_marker_inserted_for_each_removed_ad(
         self,
-        text_and_ads: tuple[str, list[tuple[int, int]]],
+        text_and_ads: tuple[str, list[tuple[int, int]], list[str]],
     ) -> None:
         """Property 10: Advertisement Removal with Markers
 
@@ -415,7 +432,7 @@ class TestAdvertisementRemovalWithMarkers:
 
         **Validates: Requirements 6.3**
         """
-        text, ad_positions = text_and_ads
+        text, ad_positions, _ = text_and_ads
 
         # Skip if no ads
         assume(len(ad_positions) > 0)
@@ -424,7 +441,7 @@ class TestAdvertisementRemovalWithMarkers:
         result = remove_advertisements(text, ad_positions)
 
         # Property: Output SHALL contain marker for each removed block
-        marker_count = result.count(f"[{ADVERTISEMENT_MARKER}]")
+        marker_count = result.count(ADVERTISEMENT_MARKER_TEXT)
         expected_count = len(ad_positions)
 
         assert marker_count == expected_count, (
@@ -434,13 +451,12 @@ class TestAdvertisementRemovalWithMarkers:
             f"Result: '{result}'"
         )
 
-    @settings(max_examples=100)
     @given(
         text_and_ads=text_with_ad_blocks_strategy(),
     )
     def test_non_ad_content_preserved(
         self,
-        text_and_ads: tuple[str, list[tuple[int, int]]],
+        text_and_ads: tuple[str, list[tuple[int, int]], list[str]],
     ) -> None:
         """Property 10: Advertisement Removal with Markers - Content Preservation
 
@@ -451,7 +467,7 @@ class TestAdvertisementRemovalWithMarkers:
 
         **Validates: Requirements 6.2**
         """
-        text, ad_positions = text_and_ads
+        text, ad_positions, _ = text_and_ads
 
         # Skip if no ads
         assume(len(ad_positions) > 0)
@@ -460,7 +476,7 @@ class TestAdvertisementRemovalWithMarkers:
         non_ad_segments: list[str] = []
         current_pos = 0
 
-        for ad_start, ad_end in sorted(ad_positions):
+        for ad_start, ad_end in ad_positions:
             if current_pos < ad_start:
                 non_ad_segments.append(text[current_pos:ad_start])
             current_pos = ad_end
@@ -481,7 +497,6 @@ class TestAdvertisementRemovalWithMarkers:
                     f"Result: '{result}'"
                 )
 
-    @settings(max_examples=100)
     @given(
         before=simple_text_strategy,
         ad_content=st.from_regex(r"AD[0-9]{1,5}", fullmatch=True),
@@ -515,15 +530,13 @@ class TestAdvertisementRemovalWithMarkers:
         assert ad_content not in result, f"Ad content '{ad_content}' should not be in result"
 
         # Property: Exactly one marker SHALL be present
-        assert result.count(f"[{ADVERTISEMENT_MARKER}]") == 1, (
-            f"Expected exactly 1 marker in result: '{result}'"
-        )
+        marker_count = result.count(ADVERTISEMENT_MARKER_TEXT)
+        assert marker_count == 1, f"Expected 1 marker, got {marker_count}. Result: '{result}'"
 
         # Property: Non-ad content SHALL be preserved
         assert before in result, f"Content before ad '{before}' should be preserved"
         assert after in result, f"Content after ad '{after}' should be preserved"
 
-    @settings(max_examples=100)
     @given(
         text=simple_text_strategy,
     )
@@ -543,17 +556,12 @@ class TestAdvertisementRemovalWithMarkers:
         # No ad positions
         result = remove_advertisements(text, [])
 
-        # Property: Original text SHALL be returned unchanged
+        # Property: Original text SHALL be returned unchanged, which also means
+        # no marker was inserted (str equality checks the lengths first)
         assert result == text, (
             f"With no ads, text should be unchanged. Expected '{text}', got '{result}'"
         )
 
-        # Property: No markers SHALL be present
-        assert ADVERTISEMENT_MARKER not in result, (
-            "No markers should be present when no ads removed"
-        )
-
-    @settings(max_examples=100)
     @given(
         part1=simple_text_strategy,
         ad1=st.from_regex(r"AD1[0-9]{1,3}", fullmatch=True),
@@ -579,15 +587,12 @@ class TestAdvertisementRemovalWithMarkers:
         **Validates: Requirements 6.2, 6.3**
         """
         # Construct text with two ads
-        text = f"{part1}{ad1}{part2}{ad2}{part3}"
-
-        # Calculate positions
-        ad1_start = len(part1)
-        ad1_end = ad1_start + len(ad1)
-        ad2_start = ad1_end + len(part2)
-        ad2_end = ad2_start + len(ad2)
+        parts = [part1, ad1, part2, ad2, part3]
+        text = "".join(parts)
 
-        ad_positions = [(ad1_start, ad1_end), (ad2_start, ad2_end)]
+        # Calculate positions from the running end offset of each part
+        ends = list(itertools.accumulate(map(len, parts)))
+        ad_positions = [(ends[0], ends[1]), (ends[2], ends[3])]
 
         # Remove advertisements
         result = remove_advertisements(text, ad_positions)
@@ -597,7 +602,7 @@ class TestAdvertisementRemovalWithMarkers:
         assert ad2 not in result, f"Ad2 '{ad2}' should not be in result"
 
         # Property: Exactly two markers SHALL be present
-        marker_count = result.count(f"[{ADVERTISEMENT_MARKER}]")
+        marker_count = result.count(ADVERTISEMENT_MARKER_TEXT)
         assert marker_count == 2, f"Expected 2 markers, got {marker_count}. Result: '{result}'"
 
         # Property: Non-ad content SHALL be preserved
@@ -605,7 +610,6 @@ class TestAdvertisementRemovalWithMarkers:
         assert part2 in result, f"Part2 '{part2}' should be preserved"
         assert part3 in result, f"Part3 '{part3}' should be preserved"
 
-    @settings(max_examples=100)
     @given(
         episode=episode_info_strategy(),
         transcription=transcription_result_strategy(),
@@ -637,11 +641,9 @@ class TestAdvertisementRemovalWithMarkers:
         # Skip if we can't create valid ad markers
         assume(ad_start < ad_end < text_len)
 
-        analysis = AnalysisResult(
-            summary=summary,
-            topics=["Test topic."],
-            keywords=["test"],
-            ad_markers=[(ad_start, ad_end)],
+        # Only the summary and ad markers vary; topics and keywords are shared
+        analysis = dataclasses.replace(
+            SAMPLE_ANALYSIS, summary=summary, ad_markers=[(ad_start, ad_end)]
         )
 
         # Generate markdown
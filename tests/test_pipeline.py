@@ -7,9 +7,11 @@ Requirements: 3.1, 4.1, 6.1, 7.1
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
@@ -29,8 +31,10 @@ from podtext.services.downloader import DownloadError
 from podtext.services.rss import EpisodeInfo
 from podtext.services.transcriber import TranscriptionError, TranscriptionResult
 
+OUTPUT_PATH_PUB_DATE = datetime(2024, 1, 15)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_episode() -> EpisodeInfo:
     """Create a sample episode for testing."""
     return EpisodeInfo(
@@ -41,7 +45,7 @@ def sample_episode() -> EpisodeInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_transcription() -> TranscriptionResult:
     """Create a sample transcription result for testing."""
     return TranscriptionResult(
@@ -51,7 +55,7 @@ def sample_transcription() -> TranscriptionResult:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_analysis() -> AnalysisResult:
     """Create a sample analysis result for testing."""
     return AnalysisResult(
@@ -75,6 +79,31 @@ def sample_config(tmp_path: Path) -> Config:
     )
 
 
+@pytest.fixture
+def stages(tmp_path: Path) -> Generator[SimpleNamespace]:
+    """Patch the pipeline's download, transcribe, analyze and output stages.
+
+    The download context manager yields a media path under tmp_path; the other
+    stages are left for each test to configure.
+    """
+    with patch.multiple(
+        "podtext.core.pipeline",
+        download_with_optional_cleanup=DEFAULT,
+        transcribe=DEFAULT,
+        analyze_content=DEFAULT,
+        generate_markdown=DEFAULT,
+    ) as mocks:
+        download = mocks["download_with_optional_cleanup"]
+        download.return_value.__enter__.return_value = tmp_path / "episode.mp3"
+        download.return_value.__exit__.return_value = False
+        yield SimpleNamespace(
+            download=download,
+            transcribe=mocks["transcribe"],
+            analyze=mocks["analyze_content"],
+            generate=mocks["generate_markdown"],
+        )
+
+
 class TestGenerateOutputPath:
     """Tests for _generate_output_path function."""
 
@@ -86,57 +115,43 @@ class TestGenerateOutputPath:
         assert path.parent.name == "My Podcast"
         assert path.suffix == ".md"
 
-    def test_sanitizes_special_characters(self, tmp_path: Path) -> None:
-        """Test that special characters are sanitized."""
-        episode = EpisodeInfo(
-            index=1,
-            title="Episode: Test/With\\Special*Characters?",
-            pub_date=datetime(2024, 1, 15),
-            media_url="https://example.com/ep.mp3",
-        )
-        path = _generate_output_path(episode, "Podcast/Name:Test", tmp_path)
-
-        # Check podcast directory name is sanitized
-        assert "/" not in path.parent.name
-        assert "\\" not in path.parent.name
-        assert ":" not in path.parent.name
-
-        # Check filename is sanitized
-        assert "/" not in path.name
-        assert "\\" not in path.name
-        assert "*" not in path.name
-        assert "?" not in path.name
-
-    def test_truncates_long_names(self, tmp_path: Path) -> None:
-        """Test that very long names are truncated to 30 chars."""
-        episode = EpisodeInfo(
-            index=1,
-            title="A" * 200,  # Very long title
-            pub_date=datetime(2024, 1, 15),
-            media_url="https://example.com/ep.mp3",
-        )
-        path = _generate_output_path(episode, "B" * 200, tmp_path)
-
-        # Podcast directory name should be max 30 chars
-        assert len(path.parent.name) <= 30
-        # Filename (without .md) should be max 30 chars
-        assert len(path.stem) <= 30
-
-    def test_handles_empty_podcast_name(self, sample_episode: EpisodeInfo, tmp_path: Path) -> None:
-        """Test fallback for empty podcast name."""
-        path = _generate_output_path(sample_episode, "", tmp_path)
-        assert path.parent.name == "unknown-podcast"
-
-    def test_handles_empty_episode_title(self, tmp_path: Path) -> None:
-        """Test fallback for empty episode title."""
+    @pytest.mark.parametrize(
+        ("index", "title", "podcast_name", "expected_dir", "expected_stem"),
+        [
+            pytest.param(
+                1,
+                "Episode: Test/With\\Special*Characters?",
+                "Podcast/Name:Test",
+                "Podcast_Name_Test",
+                "Episode_ Test_With_Special_Cha",
+                id="sanitizes_special_characters",
+            ),
+            pytest.param(1, "A" * 200, "B" * 200, "B" * 30, "A" * 30, id="truncates_long_names"),
+            pytest.param(
+                1, "Test Episode", "", "unknown-podcast", "Test Episode", id="empty_podcast_name"
+            ),
+            pytest.param(5, "", "My Podcast", "My Podcast", "episode_5", id="empty_episode_title"),
+        ],
+    )
+    def test_sanitizes_path_components(
+        self,
+        index: int,
+        title: str,
+        podcast_name: str,
+        expected_dir: str,
+        expected_stem: str,
+        tmp_path: Path,
+    ) -> None:
+        """Test sanitizing, truncation to 30 chars and fallbacks for empty names."""
         episode = EpisodeInfo(
-            index=5,
-            title="",
-            pub_date=datetime(2024, 1, 15),
+            index=index,
+            title=title,
+            pub_date=OUTPUT_PATH_PUB_DATE,
             media_url="https://example.com/ep.mp3",
         )
-        path = _generate_output_path(episode, "My Podcast", tmp_path)
-        assert path.stem == "episode_5"
+        path = _generate_output_path(episode, podcast_name, tmp_path)
+        assert path.parent.name == expected_dir
+        assert path.stem == expected_stem
 
     def test_custom_output_path_overrides(
         self, sample_episode: EpisodeInfo, tmp_path: Path
@@ -152,32 +167,21 @@ class TestRunPipeline:
     Validates: Requirements 3.1, 4.1, 6.1, 7.1
     """
 
-    @patch("podtext.core.pipeline.generate_markdown")
-    @patch("podtext.core.pipeline.analyze_content")
-    @patch("podtext.core.pipeline.transcribe")
-    @patch("podtext.core.pipeline.download_with_optional_cleanup")
     def test_successful_pipeline_execution(
         self,
-        mock_download: MagicMock,
-        mock_transcribe: MagicMock,
-        mock_analyze: MagicMock,
-        mock_generate: MagicMock,
+        stages: SimpleNamespace,
         sample_episode: EpisodeInfo,
         sample_transcription: TranscriptionResult,
         sample_analysis: AnalysisResult,
         sample_config: Config,
-        tmp_path: Path,
     ) -> None:
         """Test successful execution of the full pipeline.
 
         Validates: Requirements 3.1, 4.1, 6.1, 7.1
         """
         # Setup mocks
-        media_path = tmp_path / "episode.mp3"
-        mock_download.return_value.__enter__ = MagicMock(return_value=media_path)
-        mock_download.return_value.__exit__ = MagicMock(return_value=False)
-        mock_transcribe.return_value = sample_transcription
-        mock_analyze.return_value = sample_analysis
+        stages.transcribe.return_value = sample_transcription
+        stages.analyze.return_value = sample_analysis
 
         # Set API key in config
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
@@ -194,15 +198,14 @@ class TestRunPipeline:
         assert result.output_path.suffix == ".md"
 
         # Verify all stages were called
-        mock_download.assert_called_once()
-        mock_transcribe.assert_called_once()
-        mock_analyze.assert_called_once()
-        mock_generate.assert_called_once()
+        stages.download.assert_called_once()
+        stages.transcribe.assert_called_once()
+        stages.analyze.assert_called_once()
+        stages.generate.assert_called_once()
 
-    @patch("podtext.core.pipeline.download_with_optional_cleanup")
     def test_download_failure_raises_error(
         self,
-        mock_download: MagicMock,
+        stages: SimpleNamespace,
         sample_episode: EpisodeInfo,
         sample_config: Config,
     ) -> None:
@@ -210,62 +213,44 @@ class TestRunPipeline:
 
         Validates: Requirement 3.4
         """
-        mock_download.side_effect = DownloadError("Connection failed")
+        stages.download.side_effect = DownloadError("Connection failed")
 
         with pytest.raises(MediaDownloadError) as exc_info:
             run_pipeline(episode=sample_episode, config=sample_config)
 
         assert "download failed" in str(exc_info.value).lower()
 
-    @patch("podtext.core.pipeline.transcribe")
-    @patch("podtext.core.pipeline.download_with_optional_cleanup")
     def test_transcription_failure_raises_error(
         self,
-        mock_download: MagicMock,
-        mock_transcribe: MagicMock,
+        stages: SimpleNamespace,
         sample_episode: EpisodeInfo,
         sample_config: Config,
-        tmp_path: Path,
     ) -> None:
         """Test that transcription failure raises TranscriptionPipelineError.
 
         Validates: Requirement 4.1
         """
-        media_path = tmp_path / "episode.mp3"
-        mock_download.return_value.__enter__ = MagicMock(return_value=media_path)
-        mock_download.return_value.__exit__ = MagicMock(return_value=False)
-        mock_transcribe.side_effect = TranscriptionError("Whisper failed")
+        stages.transcribe.side_effect = TranscriptionError("Whisper failed")
 
         with pytest.raises(TranscriptionPipelineError) as exc_info:
             run_pipeline(episode=sample_episode, config=sample_config)
 
         assert "transcription failed" in str(exc_info.value).lower()
 
-    @patch("podtext.core.pipeline.generate_markdown")
-    @patch("podtext.core.pipeline.analyze_content")
-    @patch("podtext.core.pipeline.transcribe")
-    @patch("podtext.core.pipeline.download_with_optional_cleanup")
     def test_claude_unavailable_continues_with_warning(
         self,
-        mock_download: MagicMock,
-        mock_transcribe: MagicMock,
-        mock_analyze: MagicMock,
-        mock_generate: MagicMock,
+        stages: SimpleNamespace,
         sample_episode: EpisodeInfo,
         sample_transcription: TranscriptionResult,
         sample_config: Config,
-        tmp_path: Path,
     ) -> None:
         """Test that Claude API unavailability results in warning, not failure.
 
         Validates: Requirement 6.4
         """
-        media_path = tmp_path / "episode.mp3"
-        mock_download.return_value.__enter__ = MagicMock(return_value=media_path)
-        mock_download.return_value.__exit__ = MagicMock(return_value=False)
-        mock_transcribe.return_value = sample_transcription
+        stages.transcribe.return_value = sample_transcription
         # Return empty analysis (simulating API unavailable)
-        mock_analyze.return_value = AnalysisResult()
+        stages.analyze.return_value = AnalysisResult()
 
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
             result = run_pipeline(
@@ -280,27 +265,18 @@ class TestRunPipeline:
         # Should have a warning about empty analysis
         assert any("analysis" in w.stage for w in result.warnings)
 
-    @patch("podtext.core.pipeline.generate_markdown")
-    @patch("podtext.core.pipeline.transcribe")
-    @patch("podtext.core.pipeline.download_with_optional_cleanup")
     def test_no_api_key_continues_with_warning(
         self,
-        mock_download: MagicMock,
-        mock_transcribe: MagicMock,
-        mock_generate: MagicMock,
+        stages: SimpleNamespace,
         sample_episode: EpisodeInfo,
         sample_transcription: TranscriptionResult,
         sample_config: Config,
-        tmp_path: Path,
     ) -> None:
         """Test that missing API key results in warning, not failure.
 
         Validates: Requirement 6.4
         """
-        media_path = tmp_path / "episode.mp3"
-        mock_download.return_value.__enter__ = MagicMock(return_value=media_path)
-        mock_download.return_value.__exit__ = MagicMock(return_value=False)
-        mock_transcribe.return_value = sample_transcription
+        stages.transcribe.return_value = sample_transcription
 
         # Clear API key
         with patch.dict("os.environ", {}, clear=True):
@@ -313,36 +289,27 @@ class TestRunPipeline:
         assert isinstance(result, PipelineResult)
         # Should have a warning about missing API key
         assert any("api key" in w.message.lower() for w in result.warnings)
+        # Analysis should be skipped entirely
+        stages.analyze.assert_not_called()
 
-    @patch("podtext.core.pipeline.generate_markdown")
-    @patch("podtext.core.pipeline.analyze_content")
-    @patch("podtext.core.pipeline.transcribe")
-    @patch("podtext.core.pipeline.download_with_optional_cleanup")
     def test_non_english_language_warning(
         self,
-        mock_download: MagicMock,
-        mock_transcribe: MagicMock,
-        mock_analyze: MagicMock,
-        mock_generate: MagicMock,
+        stages: SimpleNamespace,
         sample_episode: EpisodeInfo,
         sample_analysis: AnalysisResult,
         sample_config: Config,
-        tmp_path: Path,
     ) -> None:
         """Test that non-English audio results in warning.
 
         Validates: Requirement 5.2
         """
-        media_path = tmp_path / "episode.mp3"
-        mock_download.return_value.__enter__ = MagicMock(return_value=media_path)
-        mock_download.return_value.__exit__ = MagicMock(return_value=False)
         # Return transcription with non-English language
-        mock_transcribe.return_value = TranscriptionResult(
+        stages.transcribe.return_value = TranscriptionResult(
             text="Bonjour le monde.",
             paragraphs=["Bonjour le monde."],
             language="fr",
         )
-        mock_analyze.return_value = sample_analysis
+        stages.analyze.return_value = sample_analysis
 
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
             result = run_pipeline(
@@ -354,34 +321,23 @@ class TestRunPipeline:
         assert result.language_detected == "fr"
         assert any("not english" in w.message.lower() for w in result.warnings)
 
-    @patch("podtext.core.pipeline.generate_markdown")
-    @patch("podtext.core.pipeline.analyze_content")
-    @patch("podtext.core.pipeline.transcribe")
-    @patch("podtext.core.pipeline.download_with_optional_cleanup")
     def test_skip_language_check_flag(
         self,
-        mock_download: MagicMock,
-        mock_transcribe: MagicMock,
-        mock_analyze: MagicMock,
-        mock_generate: MagicMock,
+        stages: SimpleNamespace,
         sample_episode: EpisodeInfo,
         sample_analysis: AnalysisResult,
         sample_config: Config,
-        tmp_path: Path,
     ) -> None:
         """Test that skip_language_check flag is passed to transcriber.
 
         Validates: Requirement 5.3
         """
-        media_path = tmp_path / "episode.mp3"
-        mock_download.return_value.__enter__ = MagicMock(return_value=media_path)
-        mock_download.return_value.__exit__ = MagicMock(return_value=False)
-        mock_transcribe.return_value = TranscriptionResult(
+        stages.transcribe.return_value = TranscriptionResult(
             text="Test",
             paragraphs=["Test"],
             language="unknown",
         )
-        mock_analyze.return_value = sample_analysis
+        stages.analyze.return_value = sample_analysis
 
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
             run_pipeline(
@@ -391,20 +347,13 @@ class TestRunPipeline:
             )
 
         # Verify skip_language_check was passed
-        mock_transcribe.assert_called_once()
-        call_kwargs = mock_transcribe.call_args[1]
+        stages.transcribe.assert_called_once()
+        call_kwargs = stages.transcribe.call_args[1]
         assert call_kwargs.get("skip_language_check") is True
 
-    @patch("podtext.core.pipeline.generate_markdown")
-    @patch("podtext.core.pipeline.analyze_content")
-    @patch("podtext.core.pipeline.transcribe")
-    @patch("podtext.core.pipeline.download_with_optional_cleanup")
     def test_custom_output_path(
         self,
-        mock_download: MagicMock,
-        mock_transcribe: MagicMock,
-        mock_analyze: MagicMock,
-        mock_generate: MagicMock,
+        stages: SimpleNamespace,
         sample_episode: EpisodeInfo,
         sample_transcription: TranscriptionResult,
         sample_analysis: AnalysisResult,
@@ -412,11 +361,8 @@ class TestRunPipeline:
         tmp_path: Path,
     ) -> None:
         """Test that custom output path is used."""
-        media_path = tmp_path / "episode.mp3"
-        mock_download.return_value.__enter__ = MagicMock(return_value=media_path)
-        mock_download.return_value.__exit__ = MagicMock(return_value=False)
-        mock_transcribe.return_value = sample_transcription
-        mock_analyze.return_value = sample_analysis
+        stages.transcribe.return_value = sample_transcription
+        stages.analyze.return_value = sample_analysis
 
         custom_output = tmp_path / "custom" / "output.md"
 
@@ -7,6 +7,7 @@ Requirements: 2.1, 2.5
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
@@ -15,6 +16,7 @@ import pytest
 
 from podtext.services.rss import (
     EpisodeInfo,
+    FeedInfo,
     RSSFeedError,
     _extract_media_url,
     _parse_feed_entries,
@@ -23,6 +25,13 @@ from podtext.services.rss import (
 )
 
 
+@pytest.fixture
+def mock_client() -> Generator[MagicMock]:
+    """Patch httpx.Client in the RSS module and yield the client it opens."""
+    with patch("podtext.services.rss.httpx.Client") as mock_client_class:
+        yield mock_client_class.return_value.__enter__.return_value
+
+
 class TestEpisodeInfo:
     """Tests for EpisodeInfo dataclass."""
 
@@ -342,23 +351,16 @@ class TestParseFeed:
 
     def test_parse_zero_limit_returns_empty(self) -> None:
         """Test that zero limit returns empty results."""
-        from podtext.services.rss import FeedInfo
-        
         result = parse_feed("https://example.com/feed.xml", limit=0)
         assert result == FeedInfo(title="", episodes=[])
 
     def test_parse_negative_limit_returns_empty(self) -> None:
         """Test that negative limit returns empty results."""
-        from podtext.services.rss import FeedInfo
-        
         result = parse_feed("https://example.com/feed.xml", limit=-5)
         assert result == FeedInfo(title="", episodes=[])
 
-    @patch("podtext.services.rss.httpx.Client")
     @patch("podtext.services.rss.feedparser.parse")
-    def test_parse_successful(
-        self, mock_feedparser: MagicMock, mock_client_class: MagicMock
-    ) -> None:
+    def test_parse_successful(self, mock_feedparser: MagicMock, mock_client: MagicMock) -> None:
         """Test successful feed parsing.
 
         Validates: Requirement 2.1
@@ -368,11 +370,7 @@ class TestParseFeed:
         mock_response.text = "<rss>...</rss>"
         mock_response.raise_for_status = MagicMock()
 
-        mock_client = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
 
         # Setup mock feedparser
         entry = MagicMock()
@@ -397,21 +395,16 @@ class TestParseFeed:
         assert result.episodes[0].index == 1
         assert result.episodes[0].media_url == "https://example.com/episode.mp3"
 
-    @patch("podtext.services.rss.httpx.Client")
     @patch("podtext.services.rss.feedparser.parse")
     def test_parse_with_custom_limit(
-        self, mock_feedparser: MagicMock, mock_client_class: MagicMock
+        self, mock_feedparser: MagicMock, mock_client: MagicMock
     ) -> None:
         """Test parsing with custom limit parameter."""
         mock_response = MagicMock()
         mock_response.text = "<rss>...</rss>"
         mock_response.raise_for_status = MagicMock()
 
-        mock_client = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
 
         entries = []
         for i in range(10):
@@ -433,21 +426,16 @@ class TestParseFeed:
         result = parse_feed("https://example.com/feed.xml", limit=5)
         assert len(result.episodes) == 5
 
-    @patch("podtext.services.rss.httpx.Client")
     @patch("podtext.services.rss.feedparser.parse")
     def test_parse_strips_url_whitespace(
-        self, mock_feedparser: MagicMock, mock_client_class: MagicMock
+        self, mock_feedparser: MagicMock, mock_client: MagicMock
     ) -> None:
         """Test that URL whitespace is stripped."""
         mock_response = MagicMock()
         mock_response.text = "<rss>...</rss>"
         mock_response.raise_for_status = MagicMock()
 
-        mock_client = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
 
         entry = MagicMock()
         entry.title = "Test Episode"
@@ -466,6 +454,26 @@ class TestParseFeed:
 
         mock_client.get.assert_called_once_with("https://example.com/feed.xml")
 
+    def test_parse_uses_charset_from_content_type(self, mock_client: MagicMock) -> None:
+        """Test that a charset given only in the HTTP header decodes the feed."""
+        feed_xml = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Zażółć gęślą jaźń</title>
+<item><title>Łódź po godzinach</title>
+<pubDate>Mon, 15 Jan 2024 12:00:00 +0000</pubDate>
+<enclosure url="https://example.com/episode.mp3" type="audio/mpeg"/></item>
+</channel></rss>"""
+        mock_client.get.return_value = httpx.Response(
+            200,
+            content=feed_xml.encode("iso-8859-2"),
+            headers={"content-type": "application/rss+xml; charset=iso-8859-2"},
+            request=httpx.Request("GET", "https://example.com/feed.xml"),
+        )
+
+        result = parse_feed("https://example.com/feed.xml")
+
+        assert result.title == "Zażółć gęślą jaźń"
+        assert result.episodes[0].title == "Łódź po godzinach"
+
 
 class TestParseFeedErrorHandling:
     """Tests for error handling in parse_feed.
@@ -473,25 +481,19 @@ class TestParseFeedErrorHandling:
     Validates: Requirement 2.5
     """
 
-    @patch("podtext.services.rss.httpx.Client")
-    def test_timeout_error(self, mock_client_class: MagicMock) -> None:
+    def test_timeout_error(self, mock_client: MagicMock) -> None:
         """Test that timeout raises RSSFeedError.
 
         Validates: Requirement 2.5
         """
-        mock_client = MagicMock()
         mock_client.get.side_effect = httpx.TimeoutException("Connection timed out")
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
 
         with pytest.raises(RSSFeedError) as exc_info:
             parse_feed("https://example.com/feed.xml")
 
         assert "timed out" in str(exc_info.value).lower()
 
-    @patch("podtext.services.rss.httpx.Client")
-    def test_http_status_error(self, mock_client_class: MagicMock) -> None:
+    def test_http_status_error(self, mock_client: MagicMock) -> None:
         """Test that HTTP error status raises RSSFeedError.
 
         Validates: Requirement 2.5
@@ -500,43 +502,33 @@ class TestParseFeedErrorHandling:
         mock_response.status_code = 404
         mock_response.text = "Not Found"
 
-        mock_client = MagicMock()
         mock_client.get.return_value = mock_response
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Not Found",
             request=MagicMock(),
             response=mock_response,
         )
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
 
         with pytest.raises(RSSFeedError) as exc_info:
             parse_feed("https://example.com/feed.xml")
 
         assert "404" in str(exc_info.value)
 
-    @patch("podtext.services.rss.httpx.Client")
-    def test_connection_error(self, mock_client_class: MagicMock) -> None:
+    def test_connection_error(self, mock_client: MagicMock) -> None:
         """Test that connection error raises RSSFeedError.
 
         Validates: Requirement 2.5
         """
-        mock_client = MagicMock()
         mock_client.get.side_effect = httpx.ConnectError("Connection refused")
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
 
         with pytest.raises(RSSFeedError) as exc_info:
             parse_feed("https://example.com/feed.xml")
 
         assert "Failed to connect" in str(exc_info.value)
 
-    @patch("podtext.services.rss.httpx.Client")
     @patch("podtext.services.rss.feedparser.parse")
     def test_invalid_feed_with_no_entries(
-        self, mock_feedparser: MagicMock, mock_client_class: MagicMock
+        self, mock_feedparser: MagicMock, mock_client: MagicMock
     ) -> None:
         """Test that invalid feed with no entries raises RSSFeedError.
 
@@ -546,11 +538,7 @@ class TestParseFeedErrorHandling:
         mock_response.text = "not valid xml"
         mock_response.raise_for_status = MagicMock()
 
-        mock_client = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
 
         mock_feed = MagicMock()
         mock_feed.entries = []
@@ -563,10 +551,9 @@ class TestParseFeedErrorHandling:
 
         assert "invalid" in str(exc_info.value).lower()
 
-    @patch("podtext.services.rss.httpx.Client")
     @patch("podtext.services.rss.feedparser.parse")
     def test_empty_feed_raises_error(
-        self, mock_feedparser: MagicMock, mock_client_class: MagicMock
+        self, mock_feedparser: MagicMock, mock_client: MagicMock
     ) -> None:
         """Test that feed with no episodes raises RSSFeedError.
 
@@ -576,11 +563,7 @@ class TestParseFeedErrorHandling:
         mock_response.text = "<rss></rss>"
         mock_response.raise_for_status = MagicMock()
 
-        mock_client = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
 
         mock_feed = MagicMock()
         mock_feed.entries = []
@@ -593,27 +576,21 @@ class TestParseFeedErrorHandling:
 
         assert "no episodes" in str(exc_info.value).lower()
 
-    @patch("podtext.services.rss.httpx.Client")
-    def test_request_error(self, mock_client_class: MagicMock) -> None:
+    def test_request_error(self, mock_client: MagicMock) -> None:
         """Test that generic request error raises RSSFeedError.
 
         Validates: Requirement 2.5
         """
-        mock_client = MagicMock()
         mock_client.get.side_effect = httpx.RequestError("Network error")
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
 
         with pytest.raises(RSSFeedError) as exc_info:
             parse_feed("https://example.com/feed.xml")
 
         assert "Failed to connect" in str(exc_info.value)
 
-    @patch("podtext.services.rss.httpx.Client")
     @patch("podtext.services.rss.feedparser.parse")
     def test_bozo_feed_with_entries_continues(
-        self, mock_feedparser: MagicMock, mock_client_class: MagicMock
+        self, mock_feedparser: MagicMock, mock_client: MagicMock
     ) -> None:
         """Test that malformed feed with entries still parses.
 
@@ -623,11 +600,7 @@ class TestParseFeedErrorHandling:
         mock_response.text = "<rss>...</rss>"
         mock_response.raise_for_status = MagicMock()
 
-        mock_client = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
 
         entry = MagicMock()
         entry.title = "Test Episode"
@@ -9,6 +9,7 @@ Requirements: 4.1, 4.2, 4.3, 5.1, 5.2, 5.3
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -27,6 +28,44 @@ from podtext.services.transcriber import (
     transcribe_with_config,
 )
 
+# _extract_paragraphs cases (segments, expected paragraphs), built once at import
+_PARAGRAPH_CASES = [
+    pytest.param([], [], id="empty_segments"),
+    pytest.param([{"text": "Hello world."}], ["Hello world."], id="single_segment"),
+    pytest.param(
+        [
+            {"text": "First sentence."},
+            {"text": "Second sentence."},
+            {"text": "Third sentence."},
+            {"text": "Fourth sentence."},
+        ],
+        ["First sentence. Second sentence.", "Third sentence. Fourth sentence."],
+        id="multiple_segments_grouped",
+    ),
+    pytest.param(
+        [
+            {"text": "First."},
+            {"text": "Second."},
+            {"text": "Third."},
+            {"text": "Fourth."},
+            {"text": "Fifth."},
+            {"text": "Sixth."},
+        ],
+        ["First. Second.", "Third. Fourth.", "Fifth. Sixth."],
+        id="breaks_at_sentence_end",
+    ),
+    pytest.param(
+        [{"text": "Hello."}, {"text": ""}, {"text": "   "}, {"text": "World."}],
+        ["Hello. World."],
+        id="empty_text_segments_ignored",
+    ),
+    pytest.param(
+        [{"text": "Hello."}, {"start": 0, "end": 1}, {"text": "World."}],
+        ["Hello. World."],
+        id="segments_without_text_key",
+    ),
+]
+
 
 class TestTranscriptionResult:
     """Tests for TranscriptionResult dataclass."""
@@ -99,72 +138,10 @@ class TestExtractParagraphs:
     Validates: Requirement 4.3
     """
 
-    def test_empty_segments(self) -> None:
-        """Test extracting paragraphs from empty segments."""
-        result = _extract_paragraphs([])
-        assert result == []
-
-    def test_single_segment(self) -> None:
-        """Test extracting paragraphs from single segment."""
-        segments = [{"text": "Hello world."}]
-        result = _extract_paragraphs(segments)
-        assert len(result) == 1
-        assert "Hello world." in result[0]
-
-    def test_multiple_segments_grouped(self) -> None:
-        """Test that multiple segments are grouped into paragraphs."""
-        segments = [
-            {"text": "First sentence."},
-            {"text": "Second sentence."},
-            {"text": "Third sentence."},
-            {"text": "Fourth sentence."},
-        ]
-        result = _extract_paragraphs(segments)
-        # Should create at least one paragraph
-        assert len(result) >= 1
-        # All text should be present
-        full_text = " ".join(result)
-        assert "First sentence" in full_text
-        assert "Fourth sentence" in full_text
-
-    def test_paragraph_breaks_at_sentence_end(self) -> None:
-        """Test that paragraphs break at sentence endings."""
-        segments = [
-            {"text": "First."},
-            {"text": "Second."},
-            {"text": "Third."},
-            {"text": "Fourth."},
-            {"text": "Fifth."},
-            {"text": "Sixth."},
-        ]
-        result = _extract_paragraphs(segments)
-        # Should have multiple paragraphs
-        assert len(result) >= 1
-
-    def test_empty_text_segments_ignored(self) -> None:
-        """Test that segments with empty text are ignored."""
-        segments = [
-            {"text": "Hello."},
-            {"text": ""},
-            {"text": "   "},
-            {"text": "World."},
-        ]
-        result = _extract_paragraphs(segments)
-        full_text = " ".join(result)
-        assert "Hello" in full_text
-        assert "World" in full_text
-
-    def test_segments_without_text_key(self) -> None:
-        """Test handling segments without text key."""
-        segments = [
-            {"text": "Hello."},
-            {"start": 0, "end": 1},  # No text key
-            {"text": "World."},
-        ]
-        result = _extract_paragraphs(segments)
-        full_text = " ".join(result)
-        assert "Hello" in full_text
-        assert "World" in full_text
+    @pytest.mark.parametrize("segments,expected", _PARAGRAPH_CASES)
+    def test_extract_paragraphs(self, segments: list[dict[str, Any]], expected: list[str]) -> None:
+        """Test paragraph extraction for each segment layout."""
+        assert _extract_paragraphs(segments) == expected
 
 
 class TestDetectLanguage:
@@ -505,7 +482,7 @@ class TestAllValidModels:
 
     @patch("podtext.services.transcriber.MLX_WHISPER_AVAILABLE", True)
     @patch("podtext.services.transcriber.mlx_whisper")
-    @pytest.mark.parametrize("model", list(VALID_MODELS))
+    @pytest.mark.parametrize("model", sorted(VALID_MODELS))
     def test_all_valid_models_accepted(
         self, mock_mlx_whisper: MagicMock, model: str, tmp_path: Path
     ) -> None:
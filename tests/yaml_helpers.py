@@ -0,0 +1,8 @@
+"""YAML helpers shared by the output tests."""
+
+from __future__ import annotations
+
+import yaml
+
+# libyaml's C loader when available; parses the same YAML as yaml.safe_load
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)